@@ -5,6 +5,21 @@ import json
 from typing import Dict, List, Optional, Any
 import re
 
+from dependency_graph import DependencyGraph, format_import_spec
+from document_index import build_document_index
+
+# Symbol kinds in the columnar details; the "kind" column holds indices into this list
+SYMBOL_KINDS = ["function", "class"]
+FUNCTION_KIND = 0
+CLASS_KIND = 1
+
+DEFAULT_SYMBOL_PAGE_SIZE = 5000
+
+# Version of the analysis output; part of the result cache key, so bump it
+# whenever the parser, scorer or analyzer output changes to invalidate results
+# cached by an earlier deploy
+ANALYSIS_VERSION = 1
+
 class ProjectAnalyzer:
     """
     Advanced project analyzer that generates unique insights based on actual content
@@ -14,9 +29,11 @@ class ProjectAnalyzer:
         """Initialize the ProjectAnalyzer"""
         self.api_key = api_key
     
-    def extract_code_insights(self, code_files: Dict[str, str]) -> Dict[str, Any]:
+    def extract_code_insights(self, code_files: Dict[str, str], detailed: bool = False) -> Dict[str, Any]:
         """
         Extract meaningful insights from code files
+
+        The per-file "details" tables are only built when detailed is True.
         """
         insights = {
             "functions": [],
@@ -30,8 +47,43 @@ class ProjectAnalyzer:
             "framework_usage": set(),
             "documentation_level": 0
         }
+        dependency_graph = DependencyGraph()
+        
+        # Per-file detail in columnar form: each table is a dict of equal-length
+        # lists, and "file" columns index into the "files" list
+        details = {
+            "files": [],
+            "symbols": {"file": [], "kind": [], "name": [], "line": []},
+            "routes": {"file": [], "line": [], "text": []},
+            "imports": {"file": [], "module": []}
+        }
+        symbols = details["symbols"]
+        routes = details["routes"]
+        
+        def add_symbol(file_index, kind, name, line_number):
+            if not detailed:
+                return
+            symbols["file"].append(file_index)
+            symbols["kind"].append(kind)
+            symbols["name"].append(name)
+            symbols["line"].append(line_number)
+        
+        def add_route(file_index, line_number, text):
+            insights["routes"].append(text)
+            if not detailed:
+                return
+            routes["file"].append(file_index)
+            routes["line"].append(line_number)
+            routes["text"].append(text)
         
         for filename, content in code_files.items():
+            file_index = len(details["files"])
+            details["files"].append(filename)
+            if dependency_graph.add_file(filename, content) and detailed:
+                for spec in dependency_graph.imports_of(filename):
+                    details["imports"]["file"].append(file_index)
+                    details["imports"]["module"].append(format_import_spec(spec))
+            
             # Detect file type
             is_python = filename.endswith('.py')
             is_javascript = filename.endswith(('.js', '.jsx', '.ts', '.tsx'))
@@ -43,7 +95,7 @@ class ProjectAnalyzer:
             lines = content.split('\n')
             doc_lines = 0
             
-            for line in lines:
+            for line_number, line in enumerate(lines, 1):
                 line = line.strip()
                 
                 # Extract functions
@@ -52,17 +104,19 @@ class ProjectAnalyzer:
                         func_name = re.search(r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)', line)
                         if func_name:
                             insights["functions"].append(func_name.group(1))
+                            add_symbol(file_index, FUNCTION_KIND, func_name.group(1), line_number)
                     
                     # Extract classes
                     elif line.startswith('class '):
                         class_name = re.search(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)', line)
                         if class_name:
                             insights["classes"].append(class_name.group(1))
+                            add_symbol(file_index, CLASS_KIND, class_name.group(1), line_number)
                     
                     # Check for FastAPI/Flask routes
                     elif '@app.route' in line or '@app.get' in line or '@app.post' in line:
                         insights["has_api"] = True
-                        insights["routes"].append(line)
+                        add_route(file_index, line_number, line)
                     
                     # Check for database operations
                     elif any(db_term in line.lower() for db_term in ['select', 'insert', 'update', 'delete', 'create table']):
@@ -82,17 +136,19 @@ class ProjectAnalyzer:
                             func_name = func_match.group(1) or func_match.group(2)
                             if func_name:
                                 insights["functions"].append(func_name)
+                                add_symbol(file_index, FUNCTION_KIND, func_name, line_number)
                     
                     # Extract classes
                     elif 'class ' in line:
                         class_match = re.search(r'class\s+(\w+)', line)
                         if class_match:
                             insights["classes"].append(class_match.group(1))
+                            add_symbol(file_index, CLASS_KIND, class_match.group(1), line_number)
                     
                     # Check for API routes
                     elif '.get(' in line or '.post(' in line or '.put(' in line or '.delete(' in line:
                         insights["has_api"] = True
-                        insights["routes"].append(line)
+                        add_route(file_index, line_number, line)
                 
                 # Count documentation lines
                 if line.startswith(('"""', "'''", '//', '/*', '*', '#')):
@@ -119,6 +175,9 @@ class ProjectAnalyzer:
         # Convert sets to lists for JSON serialization
         insights["imports"] = list(insights["imports"])
         insights["framework_usage"] = list(insights["framework_usage"])
+        insights["dependency_graph"] = dependency_graph.summary()
+        if detailed:
+            insights["details"] = details
         
         return insights
     
@@ -170,11 +229,11 @@ class ProjectAnalyzer:
         }
         
         # Process documentation content
-        content_lower = doc_content.lower()
+        index = build_document_index(doc_content)
         
         # Detect sections
         for section in sections:
-            if section in content_lower:
+            if index.has_topic(section):
                 insights["sections"].append(section)
                 
                 if section in ["requirements", "dependencies"]:
@@ -187,20 +246,18 @@ class ProjectAnalyzer:
         # Detect technologies
         for category, terms in tech_keywords.items():
             for term in terms:
-                if term in content_lower:
+                if index.mentions(term):
                     insights["mentioned_technologies"].add(term)
         
         # Extract project goals
-        goals_section = re.search(r'(?:goals?|objectives?|purpose)(.*?)(?:\n\n|\n#|$)', content_lower, re.DOTALL)
-        if goals_section:
-            goals = re.findall(r'[-*]\s*(.+)', goals_section.group(1))
-            insights["project_goals"] = [goal.strip() for goal in goals if goal.strip()]
+        insights["project_goals"] = index.extract_list(
+            ['goal', 'goals', 'objective', 'objectives', 'purpose']
+        )
         
         # Extract known issues
-        issues_section = re.search(r'(?:issues?|bugs?|limitations?|todo)(.*?)(?:\n\n|\n#|$)', content_lower, re.DOTALL)
-        if issues_section:
-            issues = re.findall(r'[-*]\s*(.+)', issues_section.group(1))
-            insights["known_issues"] = [issue.strip() for issue in issues if issue.strip()]
+        insights["known_issues"] = index.extract_list(
+            ['issue', 'issues', 'bug', 'bugs', 'limitation', 'limitations', 'todo']
+        )
         
         # Convert sets to lists for JSON serialization
         insights["mentioned_technologies"] = list(insights["mentioned_technologies"])
@@ -245,6 +302,9 @@ class ProjectAnalyzer:
             failure_points.append("No test coverage")
         if not doc_insights["has_setup_instructions"]:
             failure_points.append("Missing setup instructions")
+        dependency_graph = code_insights.get("dependency_graph", {})
+        if dependency_graph.get("cycles"):
+            failure_points.append(f"Circular imports between {len(dependency_graph['cycles'])} groups of modules")
         
         # Identify missing components
         missing_components = []
@@ -278,6 +338,8 @@ class ProjectAnalyzer:
             fix_steps.append("Improve code documentation and add JSDoc/docstring comments")
         if not doc_insights["has_setup_instructions"]:
             fix_steps.append("Add detailed setup and installation instructions")
+        if dependency_graph.get("unreachable_files"):
+            fix_steps.append(f"Remove or wire up {len(dependency_graph['unreachable_files'])} modules no entry point uses")
         
         # Recommend technologies
         recommended_technologies = []
@@ -317,16 +379,48 @@ class ProjectAnalyzer:
         self,
         code_files: Dict[str, str],
         doc_content: Optional[str] = None,
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        detailed: bool = False
     ) -> Dict[str, Any]:
         """
         Analyze project and generate personalized insights
+        
+        With detailed=True the analysis also carries the full per-file
+        insights under "details" (see page_details for the layout).
         """
         # Extract insights from code and documentation
-        code_insights = self.extract_code_insights(code_files)
+        code_insights = self.extract_code_insights(code_files, detailed)
         doc_insights = self.extract_doc_insights(doc_content)
         
         # Generate analysis
         analysis = self.generate_analysis(code_insights, doc_insights)
         
-        return analysis
\ No newline at end of file
+        if detailed:
+            analysis["details"] = code_insights["details"]
+            analysis["details"]["dependency_graph"] = code_insights["dependency_graph"]
+        
+        return analysis
+    
+    @staticmethod
+    def page_details(
+        details: Dict[str, Any],
+        offset: int = 0,
+        limit: int = DEFAULT_SYMBOL_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Compact columnar view of the detailed insights with one page of symbols
+        
+        Symbols are the only table that grows into the hundreds of thousands,
+        so they are paginated; "next_offset" is None on the last page.
+        """
+        symbols = details["symbols"]
+        total = len(symbols["name"])
+        offset = max(0, offset)
+        end = min(total, offset + max(0, limit))
+        page = dict(details)
+        page["symbol_kinds"] = SYMBOL_KINDS
+        page["symbols"] = {column: values[offset:end] for column, values in symbols.items()}
+        page["symbols_total"] = total
+        page["symbols_offset"] = offset
+        page["next_offset"] = end if end < total else None
+        return page
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Import extraction benchmark for the dependency graph
+
+Times DependencyGraph.add_file on generated JS/TS modules of growing size,
+written without semicolons (Prettier ``semi: false`` style) since that is
+where import matching used to go quadratic, and checks the imports found.
+With a budget given it exits non-zero when the largest module is slower, so
+CI can enforce it:
+
+    python bench_dependency_graph.py --blocks 1000 4000 16000 --max-ms 500
+"""
+import argparse
+import sys
+import time
+
+from dependency_graph import DependencyGraph
+
+HEADER = """import React, { useState } from 'react'
+import {
+  helper,
+  other as renamed,
+} from './helpers'
+import * as api from "./api"
+import type { Props } from './types'
+import './styles.css'
+export * from './reexported'
+"""
+EXPECTED_IMPORTS = ['react', './helpers', './api', './types', './styles.css', './reexported', './lazy']
+
+
+def semicolon_free_module(blocks: int) -> str:
+    """
+    A module of exported arrow functions and an enum, with no semicolons
+    """
+    parts = [HEADER]
+    for i in range(blocks):
+        parts.append(f"export const f{i} = (x) => {{\n  const y = x * {i}\n  return x + y\n}}\n\n")
+    parts.append("export enum Kind {\n" + ",\n".join(f"  K{i}" for i in range(blocks)) + "\n}\n")
+    parts.append("export const load = () => import('./lazy')\n")
+    return "".join(parts)
+
+
+def main() -> int:
+    """
+    Command line entry point
+    """
+    arg_parser = argparse.ArgumentParser(description="Measure import extraction time on large JS/TS modules")
+    arg_parser.add_argument("--blocks", type=int, nargs="+", default=[1000, 4000, 16000],
+                            help="Exported functions per generated module")
+    arg_parser.add_argument("--max-ms", type=float, default=None,
+                            help="Budget for the largest module")
+    args = arg_parser.parse_args()
+
+    failures = []
+    elapsed_ms = 0.0
+    for blocks in args.blocks:
+        content = semicolon_free_module(blocks)
+        graph = DependencyGraph()
+        started = time.perf_counter()
+        graph.add_file("src/module.ts", content)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"{blocks:>6} blocks {len(content) / 1024:>8.0f} KiB {elapsed_ms:>9.2f} ms")
+        imports = graph.imports_of("src/module.ts")
+        if imports != EXPECTED_IMPORTS:
+            failures.append(f"{blocks} blocks: found imports {imports}, expected {EXPECTED_IMPORTS}")
+
+    if args.max_ms is not None and elapsed_ms > args.max_ms:
+        failures.append(f"largest module took {elapsed_ms:.1f} ms, budget is {args.max_ms:.0f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Gallery size benchmark for FaceRecognizer
+
+Builds memory-mapped galleries of synthetic feature vectors (one per
+identity) and measures incremental enrollment throughput, cold open time
+and batched nearest-neighbour search latency as the gallery grows:
+
+    python bench_face_gallery.py --sizes 1000 10000 100000 1000000 --dir /tmp/galleries
+"""
+import argparse
+import os
+import shutil
+import statistics
+import time
+
+import numpy as np
+
+from face_recognition import FaceRecognizer
+
+
+def synthetic_features(rng, count, dim):
+    """
+    Random non-negative unit vectors shaped like LBP Hellinger features
+    """
+    features = np.abs(rng.standard_normal((count, dim), dtype=np.float32))
+    features /= np.linalg.norm(features, axis=1, keepdims=True)
+    return features
+
+
+def time_search(recognizer, queries, repeats):
+    """
+    Median seconds for one batched gallery search
+    """
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        recognizer.gallery.search(queries)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    """
+    Command line entry point
+    """
+    arg_parser = argparse.ArgumentParser(description="FaceRecognizer gallery size benchmark")
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    arg_parser.add_argument("--dir", default="gallery_bench", help="Where to build the galleries")
+    arg_parser.add_argument("--batch", type=int, default=8, help="Faces recognized per frame")
+    arg_parser.add_argument("--chunk", type=int, default=50000, help="Identities enrolled per call")
+    arg_parser.add_argument("--keep", action="store_true", help="Keep the gallery files afterwards")
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    probe = FaceRecognizer()
+    crops = [rng.integers(0, 256, (120, 120, 3), dtype=np.uint8) for _ in range(args.batch)]
+    started = time.perf_counter()
+    for _ in range(20):
+        probe.compute_features(crops)
+    extract_ms = (time.perf_counter() - started) / 20 * 1000
+    print(f"feature dim {probe.dim}; extracting {args.batch} faces takes {extract_ms:.2f} ms")
+    print(f"{'identities':>10} {'size MB':>9} {'enroll/s':>10} {'open ms':>8} "
+          f"{'search 1 ms':>12} {f'search {args.batch} ms':>12}")
+
+    for size in args.sizes:
+        path = os.path.join(args.dir, f"gallery_{size}")
+        shutil.rmtree(path, ignore_errors=True)
+
+        recognizer = FaceRecognizer(path)
+        started = time.perf_counter()
+        for start in range(0, size, args.chunk):
+            count = min(args.chunk, size - start)
+            recognizer.gallery.append(
+                synthetic_features(rng, count, recognizer.dim),
+                [f"person_{i}" for i in range(start, start + count)]
+            )
+        enroll_rate = size / (time.perf_counter() - started)
+        del recognizer
+
+        started = time.perf_counter()
+        recognizer = FaceRecognizer(path)
+        open_ms = (time.perf_counter() - started) * 1000
+
+        queries = synthetic_features(rng, args.batch, recognizer.dim)
+        repeats = 5 if size <= 100000 else 3
+        time_search(recognizer, queries[:1], 1)  # warm the page cache
+        single_ms = time_search(recognizer, queries[:1], repeats) * 1000
+        batch_ms = time_search(recognizer, queries, repeats) * 1000
+        size_mb = recognizer.gallery.embeddings.nbytes / (1024 * 1024)
+        print(f"{size:>10} {size_mb:>9.1f} {enroll_rate:>10.0f} {open_ms:>8.2f} {single_ms:>12.2f} {batch_ms:>12.2f}")
+
+        del recognizer
+        if not args.keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+FPS versus accuracy benchmark for FaceDetector fast modes
+
+Loads a recorded clip into memory and runs, on a single thread, full
+resolution detection (the reference), downscaled detection, and downscaled
+detection with tracking at several detection intervals. Accuracy is
+measured against the reference boxes at IoU >= 0.5:
+
+    python bench_face_tracking.py recording.mp4 --width 640 --intervals 3 5 10
+"""
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from face_recognition import FaceDetector, FaceTracker, iter_frames
+
+
+def iou(a, b):
+    """
+    Intersection over union of two (x, y, w, h) boxes
+    """
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    ix = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    iy = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = ix * iy
+    union = aw * ah + bw * bh - inter
+    return inter / union if union else 0.0
+
+
+def compare(reference, predicted, threshold=0.5):
+    """
+    Greedy matching of predicted boxes to reference boxes over all frames
+
+    Returns:
+        (precision, recall, mean IoU of matched boxes)
+    """
+    matched = 0
+    ious = []
+    predicted_total = sum(len(p) for p in predicted)
+    reference_total = sum(len(r) for r in reference)
+    for ref_boxes, pred_boxes in zip(reference, predicted):
+        unused = list(pred_boxes)
+        for ref in ref_boxes:
+            scores = [iou(ref, pred) for pred in unused]
+            if scores and max(scores) >= threshold:
+                best = int(np.argmax(scores))
+                ious.append(scores[best])
+                unused.pop(best)
+                matched += 1
+    precision = matched / predicted_total if predicted_total else 1.0
+    recall = matched / reference_total if reference_total else 1.0
+    return precision, recall, float(np.mean(ious)) if ious else 0.0
+
+
+def run_mode(detector, frames):
+    """
+    Detect faces in every frame sequentially, returning boxes and FPS
+    """
+    started = time.perf_counter()
+    boxes = [[tuple(int(v) for v in face) for face in detector.detect_faces(frame)] for frame in frames]
+    return boxes, len(frames) / (time.perf_counter() - started)
+
+
+def main():
+    """
+    Command line entry point
+    """
+    arg_parser = argparse.ArgumentParser(description="FPS vs accuracy of face detection fast modes")
+    arg_parser.add_argument("clip", help="Video file or image directory")
+    arg_parser.add_argument("--frames", type=int, default=300, help="Maximum frames to load")
+    arg_parser.add_argument("--width", type=int, default=640, help="Downscaled detection width")
+    arg_parser.add_argument("--intervals", type=int, nargs="+", default=[3, 5, 10],
+                            help="Full-detection intervals to try with tracking")
+    args = arg_parser.parse_args()
+
+    frames = []
+    for _, frame in iter_frames(args.clip):
+        frames.append(frame)
+        if len(frames) >= args.frames:
+            break
+    height, width = frames[0].shape[:2]
+    print(f"{len(frames)} frames at {width}x{height}, OpenCV {cv2.__version__}")
+
+    reference, reference_fps = run_mode(FaceDetector(), frames)
+    modes = [("downscaled", FaceDetector(detection_width=args.width))]
+    for interval in args.intervals:
+        modes.append((
+            f"downscaled + tracking K={interval}",
+            FaceTracker(FaceDetector(detection_width=args.width), detect_interval=interval)
+        ))
+
+    print(f"{'mode':<32} {'FPS':>8} {'speedup':>8} {'precision':>10} {'recall':>8} {'IoU':>6}")
+    print(f"{'full resolution (reference)':<32} {reference_fps:>8.1f} {1.0:>7.1f}x {1.0:>10.3f} {1.0:>8.3f} {1.0:>6.3f}")
+    for name, detector in modes:
+        boxes, fps = run_mode(detector, frames)
+        precision, recall, mean_iou = compare(reference, boxes)
+        print(
+            f"{name:<32} {fps:>8.1f} {fps / reference_fps:>7.1f}x "
+            f"{precision:>10.3f} {recall:>8.3f} {mean_iou:>6.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Per-frame allocation and latency benchmark for the detect/draw frame path
+
+Runs detect_faces + draw_faces over the frames of a clip with the default
+allocating path and with zero-copy buffers and in-place drawing, then the
+batch entry point on frames stacked in one array. Transient allocation per
+frame is the tracemalloc peak above the steady state (NumPy and OpenCV
+output arrays are traced):
+
+    python bench_frame_allocations.py recording.mp4 --width 640
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+
+from face_recognition import FaceDetector, iter_frames
+
+
+def measure(frames, step):
+    """
+    Run step(frame) on every frame, returning per-frame peak transient bytes
+    and latencies in milliseconds
+    """
+    # Warm up so buffers and classifier state exist before measuring
+    step(frames[0])
+
+    transient = []
+    latencies = []
+    tracemalloc.start()
+    try:
+        for frame in frames:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            started = time.perf_counter()
+            step(frame)
+            latencies.append((time.perf_counter() - started) * 1000)
+            transient.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return transient, latencies
+
+
+def report(name, transient, latencies):
+    print(
+        f"{name:<28} {statistics.mean(transient) / 1024:>12.1f} {max(transient) / 1024:>12.1f} "
+        f"{statistics.median(latencies):>9.2f} {sorted(latencies)[int(len(latencies) * 0.95) - 1]:>9.2f}"
+    )
+
+
+def main():
+    """
+    Command line entry point
+    """
+    arg_parser = argparse.ArgumentParser(description="Per-frame allocation and latency of the frame path")
+    arg_parser.add_argument("clip", help="Video file or image directory")
+    arg_parser.add_argument("--frames", type=int, default=60, help="Maximum frames to load")
+    arg_parser.add_argument("--width", type=int, default=None, help="Downscaled detection width")
+    args = arg_parser.parse_args()
+
+    frames = []
+    for _, frame in iter_frames(args.clip):
+        frames.append(frame)
+        if len(frames) >= args.frames:
+            break
+    height, width = frames[0].shape[:2]
+    print(f"{len(frames)} frames at {width}x{height} ({frames[0].nbytes / 1024:.0f} KiB each)")
+    print(f"{'mode':<28} {'mean KiB':>12} {'max KiB':>12} {'p50 ms':>9} {'p95 ms':>9}")
+
+    default = FaceDetector(detection_width=args.width)
+    report("allocating (before)", *measure(
+        frames, lambda frame: default.draw_faces(frame, default.detect_faces(frame))
+    ))
+
+    zero_copy = FaceDetector(detection_width=args.width, zero_copy=True)
+    # In-place drawing modifies its input, so give it copies and leave
+    # the shared frames clean for the runs that follow
+    report("zero-copy, in-place draw", *measure(
+        [frame.copy() for frame in frames], lambda frame: zero_copy.draw_faces(frame, zero_copy.detect_faces(frame), in_place=True)
+    ))
+    report("zero-copy, output buffer", *measure(
+        frames, lambda frame: zero_copy.draw_faces(frame, zero_copy.detect_faces(frame))
+    ))
+
+    # Batch mode: frames stacked in one array, processed in groups
+    batch_size = 8
+    stacked = np.stack(frames[:len(frames) - len(frames) % batch_size or len(frames)])
+    batches = [stacked[i:i + batch_size] for i in range(0, len(stacked), batch_size)]
+    transient, latencies = measure(batches, zero_copy.detect_faces_batch)
+    report(f"zero-copy batch of {len(batches[0])}",
+           [peak / len(batch) for peak, batch in zip(transient, batches)],
+           [latency / len(batch) for latency, batch in zip(latencies, batches)])
+
+
+if __name__ == "__main__":
+    main()
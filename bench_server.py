@@ -0,0 +1,95 @@
+"""
+Load benchmark for the analysis API
+
+Posts a generated project ZIP to /api/analyze/files with a fixed number of
+concurrent clients and reports throughput and latency. Run it against the
+server started with different WEB_CONCURRENCY values to check that
+throughput scales with worker count:
+
+    WEB_CONCURRENCY=1 gunicorn -c gunicorn.conf.py main:app
+    python bench_server.py --requests 500 --concurrency 32 --unique
+
+--unique gives every request different notes so none are served from the
+shared result store; leave it off to measure cache hits across workers.
+"""
+import argparse
+import asyncio
+import io
+import statistics
+import time
+import zipfile
+from typing import List
+
+import httpx
+
+
+def make_project_zip(files: int = 200) -> bytes:
+    """
+    Build an in-memory ZIP with a mix of Python and JS sources
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("project/README.md", "# Sample\n\n## Installation\npip install -r requirements.txt\n")
+        for i in range(files):
+            archive.writestr(
+                f"project/pkg/module_{i}.py",
+                f'"""Module {i}"""\nimport os\nfrom pkg import module_{(i + 1) % files}\n\n'
+                f"class Model{i}:\n    pass\n\ndef handler_{i}(request):\n    return os.getcwd()\n" * 5
+            )
+            archive.writestr(
+                f"project/web/component_{i}.js",
+                f"import {{ helper }} from './component_{(i + 1) % files}';\n"
+                f"const render{i} = () => helper();\napp.get('/item/{i}', render{i});\n" * 5
+            )
+    return buffer.getvalue()
+
+
+async def run(url: str, total: int, concurrency: int, unique: bool, payload: bytes) -> List[float]:
+    latencies: List[float] = []
+    counter = iter(range(total))
+
+    async with httpx.AsyncClient(timeout=120) as client:
+        async def client_loop():
+            for i in counter:
+                data = {"notes": f"request {i}"} if unique else {}
+                started = time.perf_counter()
+                response = await client.post(
+                    f"{url}/api/analyze/files",
+                    files={"code": ("project.zip", payload, "application/zip")},
+                    data=data
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    return latencies
+
+
+def main() -> None:
+    """
+    Command line entry point
+    """
+    arg_parser = argparse.ArgumentParser(description="Load benchmark for the analysis API")
+    arg_parser.add_argument("--url", default="http://localhost:8000")
+    arg_parser.add_argument("--requests", type=int, default=200)
+    arg_parser.add_argument("--concurrency", type=int, default=16)
+    arg_parser.add_argument("--files", type=int, default=200, help="Source files per generated project")
+    arg_parser.add_argument("--unique", action="store_true", help="Defeat the shared result store")
+    args = arg_parser.parse_args()
+
+    payload = make_project_zip(args.files)
+    started = time.perf_counter()
+    latencies = asyncio.run(run(args.url, args.requests, args.concurrency, args.unique, payload))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"{len(latencies)} requests in {elapsed:.2f}s: {len(latencies) / elapsed:.1f} req/s")
+    print(
+        f"latency p50 {statistics.median(latencies) * 1000:.1f} ms, "
+        f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f} ms, "
+        f"max {latencies[-1] * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
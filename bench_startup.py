@@ -0,0 +1,106 @@
+"""
+Startup benchmark for the API process
+
+Measures, in fresh interpreter processes, how long ``import main`` takes and
+the latency of the first ZIP analysis request, and reports which heavy
+dependencies were loaded by the import alone. With budgets given it exits
+non-zero when they are exceeded, so CI can enforce them:
+
+    python bench_startup.py --runs 5 --max-import-ms 1500 --max-first-request-ms 500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+CHILD_SCRIPT = r'''
+import asyncio, io, json, sys, time, zipfile
+
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+from parser import HEAVY_MODULES
+loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+
+import httpx
+
+buffer = io.BytesIO()
+with zipfile.ZipFile(buffer, "w") as archive:
+    archive.writestr("app/main.py", "import os\n\ndef run():\n    return os.getcwd()\n")
+    archive.writestr("app/README.md", "# App\n")
+
+async def first_request():
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        request_started = time.perf_counter()
+        response = await client.post(
+            "/api/analyze/files",
+            files={"code": ("project.zip", buffer.getvalue(), "application/zip")}
+        )
+        response.raise_for_status()
+        return time.perf_counter() - request_started
+
+request_seconds = asyncio.run(first_request())
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_request_ms": request_seconds * 1000,
+    "heavy_modules_loaded": loaded,
+}))
+'''
+
+
+def measure_once() -> dict:
+    """
+    Run one cold start in a fresh interpreter and return its timings
+    """
+    with tempfile.TemporaryDirectory() as store_dir:
+        env = dict(os.environ, RESULT_STORE_PATH=os.path.join(store_dir, "results.sqlite3"))
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD_SCRIPT],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    """
+    Command line entry point
+    """
+    arg_parser = argparse.ArgumentParser(description="Measure API import time and first-request latency")
+    arg_parser.add_argument("--runs", type=int, default=5)
+    arg_parser.add_argument("--max-import-ms", type=float, default=None)
+    arg_parser.add_argument("--max-first-request-ms", type=float, default=None)
+    args = arg_parser.parse_args()
+
+    results = [measure_once() for _ in range(args.runs)]
+    import_ms = statistics.median(r["import_ms"] for r in results)
+    first_request_ms = statistics.median(r["first_request_ms"] for r in results)
+    loaded = sorted({name for r in results for name in r["heavy_modules_loaded"]})
+
+    print(f"import main:   median {import_ms:.1f} ms over {args.runs} runs")
+    print(f"first request: median {first_request_ms:.1f} ms")
+    print(f"heavy modules loaded by import: {', '.join(loaded) or 'none'}")
+
+    failures = []
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        failures.append(f"import time {import_ms:.1f} ms exceeds budget of {args.max_import_ms:.0f} ms")
+    if args.max_first_request_ms is not None and first_request_ms > args.max_first_request_ms:
+        failures.append(
+            f"first request {first_request_ms:.1f} ms exceeds budget of {args.max_first_request_ms:.0f} ms"
+        )
+    if loaded:
+        failures.append(f"heavy modules imported eagerly: {', '.join(loaded)}")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Offline bulk analysis CLI
+
+Runs the same FileParser -> ProjectScorer -> ProjectAnalyzer pipeline as the
+API over a directory of project archives (or a manifest), using a process pool
+and streaming one JSON result per line as each project finishes.
+
+Usage:
+    python bulk_analyze.py projects/ -o results.jsonl
+    python bulk_analyze.py manifest.jsonl -o results.jsonl --workers 8
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from parser import FileParser
+from scorer import ProjectScorer
+from ai_module import ProjectAnalyzer
+
+DOC_EXTENSIONS = ('.pdf', '.docx')
+
+# Per-worker component instances, created once by _init_worker and reused
+# for every project the worker handles.
+_worker_state: Dict[str, Any] = {}
+
+
+def discover_jobs(source: str) -> List[Dict[str, Any]]:
+    """
+    Build the job list from a directory or a manifest file.
+
+    A directory is scanned recursively for ``.zip`` archives; a PDF/DOCX with
+    the same stem next to an archive is used as its documentation. A manifest
+    has one entry per line, either a bare path to a zip or a JSON object with
+    ``code``, ``documentation``, ``notes`` and an optional ``id``.
+    """
+    if os.path.isdir(source):
+        return _discover_directory(source)
+    return _read_manifest(source)
+
+
+def _discover_directory(root: str) -> List[Dict[str, Any]]:
+    jobs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        names = set(filenames)
+        for filename in sorted(filenames):
+            if not filename.endswith('.zip'):
+                continue
+            stem = filename[:-len('.zip')]
+            documentation = None
+            for ext in DOC_EXTENSIONS:
+                if stem + ext in names:
+                    documentation = os.path.join(dirpath, stem + ext)
+                    break
+            code_path = os.path.join(dirpath, filename)
+            jobs.append({
+                "id": os.path.relpath(code_path, root),
+                "code": code_path,
+                "documentation": documentation,
+                "notes": None,
+            })
+    return jobs
+
+
+def _read_manifest(manifest_path: str) -> List[Dict[str, Any]]:
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    jobs = []
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('{'):
+                entry = json.loads(line)
+            else:
+                entry = {"code": line}
+            if not entry.get("code") and not entry.get("documentation"):
+                raise ValueError(f"{manifest_path}:{line_number}: entry has neither code nor documentation")
+            for key in ("code", "documentation"):
+                if entry.get(key) and not os.path.isabs(entry[key]):
+                    entry[key] = os.path.join(base_dir, entry[key])
+            jobs.append({
+                "id": entry.get("id") or entry.get("code") or entry.get("documentation"),
+                "code": entry.get("code"),
+                "documentation": entry.get("documentation"),
+                "notes": entry.get("notes"),
+            })
+    return jobs
+
+
+def load_completed_ids(output_path: str) -> Set[str]:
+    """
+    Collect the ids of projects already analyzed successfully in an existing
+    output file, so an interrupted run can be resumed. Failed entries and
+    unparseable lines are ignored and will be retried.
+    """
+    completed = set()
+    if not os.path.exists(output_path):
+        return completed
+    with open(output_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if "result" in record:
+                completed.add(record["id"])
+    return completed
+
+
+def truncate_partial_line(output_path: str) -> None:
+    """
+    Cut an interrupted run's output back to its last complete line, so
+    resumed records are not appended onto a partially written one
+    """
+    if not os.path.exists(output_path):
+        return
+    with open(output_path, 'rb+') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            step = min(65536, position)
+            f.seek(position - step)
+            chunk = f.read(step)
+            newline = chunk.rfind(b'\n')
+            if newline != -1:
+                position = position - step + newline + 1
+                break
+            position -= step
+        if position != end:
+            f.truncate(position)
+
+
+def _init_worker() -> None:
+    """
+    Create the pipeline components once per worker process
+    """
+    _worker_state["parser"] = FileParser()
+    _worker_state["scorer"] = ProjectScorer()
+    _worker_state["analyzer"] = ProjectAnalyzer()
+    _worker_state["loop"] = asyncio.new_event_loop()
+
+
+def analyze_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Analyze a single project inside a worker process
+    """
+    file_parser = _worker_state["parser"]
+    started = time.perf_counter()
+    input_bytes = 0
+    try:
+        code_content = {}
+        doc_content = None
+
+        if job.get("code"):
+            input_bytes += os.path.getsize(job["code"])
+            code_content = file_parser.parse_zip(job["code"])
+
+        documentation = job.get("documentation")
+        if documentation:
+            input_bytes += os.path.getsize(documentation)
+            if documentation.endswith('.pdf'):
+                doc_content = file_parser.parse_pdf(documentation)
+            elif documentation.endswith('.docx'):
+                doc_content = file_parser.parse_docx(documentation)
+
+        scores = _worker_state["scorer"].generate_project_score(code_content, doc_content)
+        analysis = _worker_state["loop"].run_until_complete(
+            _worker_state["analyzer"].analyze_project(code_content, doc_content, job.get("notes"))
+        )
+        analysis["scores"] = scores
+        record = {"id": job["id"], "result": analysis}
+    except Exception as e:
+        record = {"id": job["id"], "error": f"{type(e).__name__}: {e}"}
+
+    record["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    record["input_bytes"] = input_bytes
+    return record
+
+
+def run_pipeline(
+    jobs: Iterable[Dict[str, Any]],
+    workers: int,
+    chunksize: int = 1,
+    maxtasksperchild: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield analysis records in completion order using a process pool
+    """
+    with Pool(processes=workers, initializer=_init_worker, maxtasksperchild=maxtasksperchild) as pool:
+        yield from pool.imap_unordered(analyze_job, jobs, chunksize=chunksize)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point
+    """
+    arg_parser = argparse.ArgumentParser(description="Bulk-analyze project archives offline")
+    arg_parser.add_argument("source", help="Directory of .zip archives or a manifest file")
+    arg_parser.add_argument("-o", "--output", required=True, help="JSONL file to write results to")
+    arg_parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                            help="Number of worker processes (default: CPU count)")
+    arg_parser.add_argument("--chunksize", type=int, default=1,
+                            help="Jobs handed to a worker at a time")
+    arg_parser.add_argument("--max-tasks-per-worker", type=int, default=None,
+                            help="Recycle each worker after this many projects")
+    arg_parser.add_argument("--no-resume", action="store_true",
+                            help="Overwrite the output file instead of resuming from it")
+    args = arg_parser.parse_args(argv)
+
+    jobs = discover_jobs(args.source)
+    total = len(jobs)
+
+    if args.no_resume:
+        completed = set()
+        mode = 'w'
+    else:
+        truncate_partial_line(args.output)
+        completed = load_completed_ids(args.output)
+        mode = 'a'
+    pending = [job for job in jobs if job["id"] not in completed]
+    skipped = total - len(pending)
+
+    succeeded = 0
+    failed = 0
+    input_bytes = 0
+    started = time.perf_counter()
+
+    with open(args.output, mode, encoding='utf-8') as out:
+        for record in run_pipeline(pending, args.workers, args.chunksize, args.max_tasks_per_worker):
+            out.write(json.dumps(record) + '\n')
+            out.flush()
+            input_bytes += record["input_bytes"]
+            if "result" in record:
+                succeeded += 1
+            else:
+                failed += 1
+                print(f"failed: {record['id']}: {record['error']}", file=sys.stderr)
+
+    elapsed = time.perf_counter() - started
+    processed = succeeded + failed
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    mb_rate = input_bytes / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{total} projects: {succeeded} analyzed, {failed} failed, {skipped} skipped (already done)\n"
+        f"{elapsed:.2f}s elapsed, {rate:.1f} projects/s, {mb_rate:.1f} MB/s with {args.workers} workers"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
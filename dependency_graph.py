@@ -0,0 +1,396 @@
+"""
+Cross-file import/dependency graph index
+
+Resolves Python and JS/TS imports to files inside an uploaded project and
+stores the resulting graph as compact integer-id adjacency arrays (CSR), so
+reachability, orphaned files and import cycles can be computed in linear time.
+"""
+import posixpath
+import re
+from array import array
+from typing import Dict, List, Optional, Set
+
+PYTHON_EXTENSIONS = ('.py',)
+JS_EXTENSIONS = ('.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs')
+JS_RESOLVE_SUFFIXES = ('', '.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs',
+                       '/index.ts', '/index.tsx', '/index.js', '/index.jsx')
+
+ENTRY_POINT_NAMES = {
+    'main.py', 'app.py', 'manage.py', '__main__.py', 'wsgi.py', 'asgi.py',
+    'setup.py', 'conftest.py',
+    'main.js', 'main.jsx', 'main.ts', 'main.tsx',
+    'index.js', 'index.jsx', 'index.ts', 'index.tsx',
+    'server.js', 'server.ts', 'app.js', 'app.ts',
+}
+
+PY_IMPORT_RE = re.compile(
+    r'^[ \t]*import[ \t]+([\w.]+(?:[ \t]+as[ \t]+\w+)?(?:[ \t]*,[ \t]*[\w.]+(?:[ \t]+as[ \t]+\w+)?)*)',
+    re.MULTILINE
+)
+PY_FROM_RE = re.compile(
+    r'^[ \t]*from[ \t]+(\.*[\w.]*)[ \t]+import[ \t]+(?:\(([^)]*)\)|([^\n#]*))',
+    re.MULTILINE
+)
+PY_MAIN_GUARD_RE = re.compile(r'''__name__\s*==\s*['"]__main__['"]''')
+# The import clause is matched structurally (default name, namespace or a
+# braced list) rather than as "anything up to from", so a declaration such as
+# "export const f = ..." fails at once instead of scanning ahead to the next
+# quote, which is quadratic on files written without semicolons
+JS_IMPORT_CLAUSE = (
+    r'''(?:type\s+)?(?:[\w$]+\s*,\s*)?(?:[\w$]+|\*(?:\s+as\s+[\w$]+)?|\{[^{}'"]*\})'''
+)
+JS_STATIC_IMPORT_RE = re.compile(
+    r'''^[ \t]*(?:import|export)[ \t]+(?:''' + JS_IMPORT_CLAUSE + r'''\s*from[ \t]*)?['"]([^'"\n]+)['"]''',
+    re.MULTILINE
+)
+JS_CALL_IMPORT_RE = re.compile(r'''\b(?:require|import)\s*\(\s*['"]([^'"\n]+)['"]\s*\)''')
+
+
+def format_import_spec(spec: str) -> str:
+    """
+    Render a recorded import specifier for display (``pkg:name`` -> ``pkg.name``)
+    """
+    module, _, name = spec.partition(':')
+    if not name:
+        return module
+    if not module or module.endswith('.'):
+        return module + name
+    return f"{module}.{name}"
+
+
+def is_graph_file(path: str) -> bool:
+    """
+    Whether a file takes part in the dependency graph
+    """
+    return path.endswith(PYTHON_EXTENSIONS + JS_EXTENSIONS)
+
+
+def is_entry_point(path: str) -> bool:
+    """
+    Detect entry points (scripts, app roots, tests, tool configs, type declarations) from the file name
+    """
+    name = posixpath.basename(path)
+    if name in ENTRY_POINT_NAMES:
+        return True
+    if name.startswith('test_') or name.endswith('_test.py'):
+        return True
+    return any(marker in name for marker in ('.test.', '.spec.', '.config.', '.d.ts'))
+
+
+class DependencyGraph:
+    """
+    Import graph over the files of a single project.
+
+    Files are added one at a time during the scan with ``add_file``; import
+    resolution and the adjacency arrays are built lazily on the first query.
+    Nodes are integer ids in insertion order, and edges are stored as
+    ``offsets``/``targets`` arrays where the successors of node ``i`` are
+    ``targets[offsets[i]:offsets[i + 1]]``.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._paths: List[str] = []
+        self._specs: List[List[str]] = []
+        self._entry = bytearray()
+        self._offsets: Optional[array] = None
+        self._targets: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def add_file(self, path: str, content: str) -> bool:
+        """
+        Register a file and record its raw import specifiers.
+
+        Returns False for files that do not take part in the graph.
+        """
+        if not is_graph_file(path):
+            return False
+        path = path.replace('\\', '/')
+        if path in self._ids:
+            return True
+
+        if path.endswith(PYTHON_EXTENSIONS):
+            specs = self._python_specs(content)
+            entry = is_entry_point(path) or PY_MAIN_GUARD_RE.search(content) is not None
+        else:
+            specs = [m.group(1) for m in JS_STATIC_IMPORT_RE.finditer(content)]
+            specs.extend(m.group(1) for m in JS_CALL_IMPORT_RE.finditer(content))
+            entry = is_entry_point(path)
+
+        self._ids[path] = len(self._paths)
+        self._paths.append(path)
+        self._specs.append(specs)
+        self._entry.append(1 if entry else 0)
+        self._offsets = None
+        return True
+
+    @staticmethod
+    def _python_specs(content: str) -> List[str]:
+        """
+        Extract import specifiers as dotted names; ``from X import a`` yields
+        ``X:a`` so the resolver can try both the submodule and the package.
+        """
+        specs = []
+        for match in PY_IMPORT_RE.finditer(content):
+            for part in match.group(1).split(','):
+                name = part.split()[0] if part.split() else ''
+                if name:
+                    specs.append(name)
+        for match in PY_FROM_RE.finditer(content):
+            module = match.group(1)
+            names = match.group(2) if match.group(2) is not None else match.group(3)
+            imported = [n.split()[0] for n in names.replace('\\', ' ').split(',') if n.split()]
+            if not imported:
+                specs.append(module)
+            for name in imported:
+                specs.append(f"{module}:{name}" if name != '*' else module)
+        return specs
+
+    def imports_of(self, path: str) -> List[str]:
+        """
+        Raw import specifiers recorded for a file
+        """
+        return list(self._specs[self._ids[path.replace('\\', '/')]])
+
+    def build(self) -> None:
+        """
+        Resolve all recorded imports and build the adjacency arrays
+        """
+        if self._offsets is not None:
+            return
+
+        module_index = self._python_module_index()
+        offsets = array('l', [0])
+        targets = array('l')
+
+        for node, path in enumerate(self._paths):
+            if path.endswith(PYTHON_EXTENSIONS):
+                resolved = self._resolve_python(path, self._specs[node], module_index)
+            else:
+                resolved = self._resolve_js(path, self._specs[node])
+            targets.extend(sorted(resolved))
+            offsets.append(len(targets))
+
+        self._offsets = offsets
+        self._targets = targets
+
+    def _python_module_index(self) -> Dict[str, int]:
+        """
+        Map dotted module names to node ids.
+
+        Every dotted suffix of a file's path is registered so imports resolve
+        regardless of which directory the project was run from; on clashes the
+        shallowest file wins.
+        """
+        index: Dict[str, int] = {}
+        for node, path in enumerate(self._paths):
+            if not path.endswith(PYTHON_EXTENSIONS):
+                continue
+            parts = path[:-len('.py')].split('/')
+            if parts[-1] == '__init__':
+                parts.pop()
+            for start in range(len(parts) - 1, -1, -1):
+                key = '.'.join(parts[start:])
+                if not key:
+                    continue
+                current = index.get(key)
+                if current is None or self._paths[current].count('/') > path.count('/'):
+                    index[key] = node
+        return index
+
+    def _resolve_python(self, path: str, specs: List[str], module_index: Dict[str, int]) -> Set[int]:
+        package = path.split('/')[:-1]
+        resolved = set()
+
+        def lookup(dotted: str, sibling_first: bool) -> Optional[int]:
+            if not dotted:
+                return None
+            if sibling_first and package:
+                node = module_index.get('.'.join(package) + '.' + dotted)
+                if node is not None:
+                    return node
+            return module_index.get(dotted)
+
+        for spec in specs:
+            module, _, name = spec.partition(':')
+            level = len(module) - len(module.lstrip('.'))
+            module = module[level:]
+            if level:
+                if level - 1 > len(package):
+                    continue
+                base = package[:len(package) - (level - 1)]
+                module = '.'.join(base + ([module] if module else []))
+                sibling_first = False
+            else:
+                sibling_first = True
+
+            candidates = [lookup(module, sibling_first)]
+            if name:
+                candidates.append(lookup(f"{module}.{name}" if module else name, sibling_first))
+            for node in candidates:
+                if node is not None:
+                    resolved.add(node)
+
+        # "from . import x" inside a package's __init__ resolves the package to itself
+        resolved.discard(self._ids[path])
+        return resolved
+
+    def _resolve_js(self, path: str, specs: List[str]) -> Set[int]:
+        directory = posixpath.dirname(path)
+        resolved = set()
+        for spec in specs:
+            if not spec.startswith('.'):
+                continue
+            target = posixpath.normpath(posixpath.join(directory, spec))
+            candidates = [target + suffix for suffix in JS_RESOLVE_SUFFIXES]
+            if target.endswith(('.js', '.jsx', '.mjs', '.cjs')):
+                stem = target.rsplit('.', 1)[0]
+                candidates.extend((stem + '.ts', stem + '.tsx'))
+            for candidate in candidates:
+                node = self._ids.get(candidate)
+                if node is not None:
+                    resolved.add(node)
+                    break
+        return resolved
+
+    def successors(self, path: str) -> List[str]:
+        """
+        Files directly imported by ``path``
+        """
+        self.build()
+        node = self._ids[path.replace('\\', '/')]
+        return [self._paths[t] for t in self._targets[self._offsets[node]:self._offsets[node + 1]]]
+
+    def entry_points(self) -> List[str]:
+        """
+        Files detected as entry points
+        """
+        return [path for node, path in enumerate(self._paths) if self._entry[node]]
+
+    def _reachable_mask(self, roots: List[int]) -> bytearray:
+        self.build()
+        offsets, targets = self._offsets, self._targets
+        seen = bytearray(len(self._paths))
+        stack = []
+        for root in roots:
+            if not seen[root]:
+                seen[root] = 1
+                stack.append(root)
+        while stack:
+            node = stack.pop()
+            for edge in range(offsets[node], offsets[node + 1]):
+                target = targets[edge]
+                if not seen[target]:
+                    seen[target] = 1
+                    stack.append(target)
+        return seen
+
+    def reachable(self, roots: Optional[List[str]] = None) -> List[str]:
+        """
+        Files reachable from ``roots`` (default: all entry points)
+        """
+        if roots is None:
+            root_ids = [node for node in range(len(self._paths)) if self._entry[node]]
+        else:
+            root_ids = [self._ids[path.replace('\\', '/')] for path in roots]
+        seen = self._reachable_mask(root_ids)
+        return [path for node, path in enumerate(self._paths) if seen[node]]
+
+    def unreachable_files(self) -> List[str]:
+        """
+        Files no entry point can reach (likely dead modules).
+
+        Empty when no entry point was detected, since nothing can be concluded.
+        """
+        root_ids = [node for node in range(len(self._paths)) if self._entry[node]]
+        if not root_ids:
+            return []
+        seen = self._reachable_mask(root_ids)
+        return [path for node, path in enumerate(self._paths) if not seen[node]]
+
+    def orphaned_files(self) -> List[str]:
+        """
+        Files that are never imported and are not entry points themselves
+        """
+        self.build()
+        imported = bytearray(len(self._paths))
+        for target in self._targets:
+            imported[target] = 1
+        return [
+            path for node, path in enumerate(self._paths)
+            if not imported[node] and not self._entry[node]
+        ]
+
+    def cycles(self) -> List[List[str]]:
+        """
+        Import cycles, as the strongly connected components with more than one
+        file (or a file importing itself), found with an iterative Tarjan pass.
+        """
+        self.build()
+        offsets, targets = self._offsets, self._targets
+        size = len(self._paths)
+        index = array('l', [-1]) * size
+        low = array('l', [0]) * size
+        on_stack = bytearray(size)
+        stack: List[int] = []
+        counter = 0
+        result = []
+
+        for root in range(size):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [[root, offsets[root]]]
+            while work:
+                frame = work[-1]
+                node, edge = frame
+                if edge < offsets[node + 1]:
+                    frame[1] = edge + 1
+                    target = targets[edge]
+                    if index[target] == -1:
+                        index[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = 1
+                        work.append([target, offsets[target]])
+                    elif on_stack[target] and index[target] < low[node]:
+                        low[node] = index[target]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    self_loop = node in targets[offsets[node]:offsets[node + 1]]
+                    if len(component) > 1 or self_loop:
+                        result.append(sorted(self._paths[m] for m in component))
+
+        return result
+
+    def summary(self) -> Dict[str, object]:
+        """
+        JSON-serializable overview of the graph
+        """
+        self.build()
+        return {
+            "files": len(self._paths),
+            "edges": len(self._targets),
+            "entry_points": self.entry_points(),
+            "orphaned_files": self.orphaned_files(),
+            "unreachable_files": self.unreachable_files(),
+            "cycles": self.cycles(),
+        }
@@ -0,0 +1,237 @@
+"""
+Section-tree index over project documentation
+
+Parses a document once into a heading/section tree with character offsets,
+plus the list items, code blocks and word set needed by documentation scoring
+and insight extraction, so those become index lookups instead of repeated
+scans of the whole text.
+
+Headings come from markdown ATX (``# Title``) and setext (``Title`` over
+``===``) syntax. FileParser renders DOCX heading styles and PDF font-size
+cues as markdown headings, so all formats share this one parser. Short lines
+ending in a colon (``Goals:``) are indexed as label sections below every real
+heading level.
+"""
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Iterable, List, Optional, Set
+
+ATX_HEADING_RE = re.compile(r'^ {0,3}(#{1,6})[ \t]+(.*?)[ \t#]*$')
+SETEXT_UNDERLINE_RE = re.compile(r'^ {0,3}(=+|-+)[ \t]*$')
+FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+LIST_ITEM_RE = re.compile(r'^[ \t]*(?:[-*+•]|\d+[.)])[ \t]+(.+)$')
+WORD_RE = re.compile(r'[a-z0-9]+')
+
+LABEL_LEVEL = 7
+LABEL_MAX_LENGTH = 60
+
+
+class Section:
+    """
+    A heading and the span of text it governs
+    """
+    __slots__ = ('title', 'level', 'start', 'body_start', 'end', 'parent', 'children', 'title_words')
+
+    def __init__(self, title: str, level: int, start: int, body_start: int, parent: Optional['Section']):
+        self.title = title
+        self.level = level
+        self.start = start
+        self.body_start = body_start
+        self.end = -1
+        self.parent = parent
+        self.children: List['Section'] = []
+        self.title_words: Set[str] = set(WORD_RE.findall(title.lower()))
+
+    def __repr__(self) -> str:
+        return f"Section({self.title!r}, level={self.level}, start={self.start}, end={self.end})"
+
+
+class DocumentIndex:
+    """
+    Heading tree, list items, code blocks and vocabulary of a document
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        self.words: Set[str] = set(WORD_RE.findall(self.lower))
+        self.line_count = text.count('\n') + 1
+        self.root = Section('', 0, 0, 0, None)
+        self.sections: List[Section] = []
+        # (offset, item text) for every list item, in document order
+        self.list_items: List[tuple] = []
+        # (start, end) character offsets of fenced and indented code blocks
+        self.code_blocks: List[tuple] = []
+        # whether the document has any real (non-label) headings
+        self.has_headings = False
+        self._build()
+
+    def _build(self) -> None:
+        text = self.text
+        stack = [self.root]
+        fence = None
+        fence_start = 0
+        indented_start = None
+        previous_blank = True
+        previous_heading = False
+        previous_text = None
+        previous_offset = 0
+        offset = 0
+
+        for line in text.split('\n'):
+            line_end = offset + len(line)
+            stripped = line.strip()
+            blank = not stripped
+
+            fence_match = FENCE_RE.match(line)
+            if fence is not None:
+                if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence):
+                    self.code_blocks.append((fence_start, line_end))
+                    fence = None
+                offset = line_end + 1
+                previous_blank = blank
+                previous_heading = False
+                previous_text = None
+                continue
+            if fence_match:
+                fence = fence_match.group(1)
+                fence_start = offset
+                offset = line_end + 1
+                previous_heading = False
+                previous_text = None
+                continue
+
+            # Indented code starts after a blank line or directly under a
+            # heading or label line, which a paragraph cannot continue
+            indented = line.startswith(('    ', '\t')) and not blank
+            if (indented and indented_start is None and (previous_blank or previous_heading)
+                    and not LIST_ITEM_RE.match(line)):
+                indented_start = offset
+            elif not indented and not blank and indented_start is not None:
+                self.code_blocks.append((indented_start, previous_offset))
+                indented_start = None
+
+            heading = None
+            atx = ATX_HEADING_RE.match(line)
+            if atx:
+                heading = (atx.group(2), len(atx.group(1)), offset)
+            elif previous_text is not None and SETEXT_UNDERLINE_RE.match(line):
+                heading = (previous_text[0], 1 if '=' in line else 2, previous_text[1])
+            elif (stripped.endswith(':') and 1 < len(stripped) <= LABEL_MAX_LENGTH
+                    and not LIST_ITEM_RE.match(line) and not indented):
+                heading = (stripped[:-1], LABEL_LEVEL, offset)
+
+            if heading is not None:
+                title, level, start = heading
+                while stack[-1].level >= level:
+                    stack.pop().end = start
+                section = Section(title.strip(), level, start, line_end + 1, stack[-1])
+                stack[-1].children.append(section)
+                self.sections.append(section)
+                stack.append(section)
+                previous_text = None
+            else:
+                item = LIST_ITEM_RE.match(line)
+                if item:
+                    self.list_items.append((offset, item.group(1).strip()))
+                previous_text = (stripped, offset) if not blank and not item and not indented else None
+
+            previous_blank = blank
+            previous_heading = heading is not None
+            if not blank:
+                previous_offset = line_end
+            offset = line_end + 1
+
+        if fence is not None:
+            self.code_blocks.append((fence_start, len(text)))
+        if indented_start is not None:
+            self.code_blocks.append((indented_start, previous_offset))
+        for section in stack:
+            section.end = len(text)
+        self._item_offsets = [item_offset for item_offset, _ in self.list_items]
+        self.has_headings = any(section.level < LABEL_LEVEL for section in self.sections)
+
+    def find_sections(self, keywords: Iterable[str]) -> List[Section]:
+        """
+        Sections whose heading contains any of the keywords as a word
+        """
+        keywords = set(keywords)
+        return [section for section in self.sections if section.title_words & keywords]
+
+    def mentions(self, term: str) -> bool:
+        """
+        Whether a term appears in the document as a whole word (or phrase)
+        """
+        if ' ' in term:
+            return term in self.lower
+        return term in self.words
+
+    def has_topic(self, keyword: str) -> bool:
+        """
+        Whether the document covers a topic.
+
+        Structured documents must have a heading for it; documents without
+        headings fall back to the word appearing anywhere.
+        """
+        if self.has_headings:
+            return bool(self.find_sections((keyword,)))
+        return self.mentions(keyword)
+
+    def items_in(self, section: Section) -> List[str]:
+        """
+        List items inside a section (including its subsections)
+        """
+        return self._items_between(section.body_start, section.end)
+
+    def _items_between(self, start: int, end: int) -> List[str]:
+        first = bisect_left(self._item_offsets, start)
+        last = bisect_left(self._item_offsets, end, first)
+        return [item for _, item in self.list_items[first:last]]
+
+    def extract_list(self, keywords: Iterable[str]) -> List[str]:
+        """
+        List items under the first section titled with one of the keywords.
+
+        Without a matching heading, falls back to the list items of the
+        paragraph following the first line that mentions a keyword.
+        """
+        keywords = set(keywords)
+        for section in self.find_sections(keywords):
+            items = self.items_in(section)
+            if items:
+                return items
+        return self._paragraph_list(keywords)
+
+    def _paragraph_list(self, keywords: Set[str]) -> List[str]:
+        if not keywords & self.words:
+            return []
+        offset = 0
+        lines = self.lower.split('\n')
+        for number, line in enumerate(lines):
+            if keywords & set(WORD_RE.findall(line)):
+                start = offset + len(line) + 1
+                end = start
+                for following in lines[number + 1:]:
+                    if not following.strip():
+                        break
+                    end += len(following) + 1
+                return self._items_between(start, end)
+            offset += len(line) + 1
+        return []
+
+    @property
+    def has_code_examples(self) -> bool:
+        """
+        Whether the document contains code blocks or example/usage labels
+        """
+        return bool(self.code_blocks) or 'example:' in self.lower or 'usage:' in self.lower
+
+
+@lru_cache(maxsize=4)
+def build_document_index(text: str) -> DocumentIndex:
+    """
+    Build (or reuse) the index for a document, so the scorer and the
+    analyzer share one parse per request
+    """
+    return DocumentIndex(text)
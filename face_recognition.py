@@ -5,19 +5,59 @@ This project includes basic face detection but lacks a frontend interface
 and complete integration.
 """
 
+import argparse
+import json
+import os
+import threading
+import time
+from collections import deque
+
 import cv2
 import numpy as np
-import os
 
 # Haar cascade for face detection
-face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+CASCADE_PATH = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+face_cascade = cv2.CascadeClassifier(CASCADE_PATH)
 
 class FaceDetector:
     """
     Basic face detection functionality
     """
-    def __init__(self):
-        self.face_cascade = face_cascade
+    def __init__(self, own_cascade=False, detection_width=None, zero_copy=False):
+        """
+        Args:
+            own_cascade: Load a private classifier instead of sharing the module one
+            detection_width: Detect on a grayscale frame downscaled to at most
+                this width and map boxes back to full resolution (None detects
+                at full resolution)
+            zero_copy: Reuse preallocated grayscale, downscaled and output
+                buffers instead of allocating new arrays for every frame. The
+                image returned by draw_faces is then only valid until the next call.
+        """
+        # CascadeClassifier is not thread-safe, so detectors used from
+        # several threads at once load their own copy
+        self.face_cascade = cv2.CascadeClassifier(CASCADE_PATH) if own_cascade else face_cascade
+        self.detection_width = detection_width
+        self.zero_copy = zero_copy
+        self._buffers = {}
+    
+    def _buffer(self, name, shape):
+        """
+        Preallocated uint8 buffer for the current resolution, reallocated
+        only when the frame size changes
+        """
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = self._buffers[name] = np.empty(shape, dtype=np.uint8)
+        return buffer
+    
+    def to_gray(self, image):
+        """
+        Convert a BGR image to grayscale (into a reused buffer in zero-copy mode)
+        """
+        if self.zero_copy:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=self._buffer('gray', image.shape[:2]))
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     
     def detect_faces(self, image):
         """
@@ -30,7 +70,53 @@ class FaceDetector:
             List of face coordinates (x, y, w, h)
         """
         # Convert to grayscale for detection
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = self.to_gray(image)
+        
+        return self.detect_gray(gray)
+    
+    def detect_faces_batch(self, frames):
+        """
+        Detect faces in a batch of frames
+        
+        Args:
+            frames: Frames stacked in one array of shape (N, H, W, 3), or a
+                list of frames
+            
+        Returns:
+            List with the face coordinates of each frame
+        """
+        if isinstance(frames, np.ndarray) and frames.ndim == 4 and frames.flags.c_contiguous:
+            # Convert the whole stack to grayscale in one call
+            count, height, width = frames.shape[:3]
+            flat = frames.reshape(count * height, width, 3)
+            if self.zero_copy:
+                grays = cv2.cvtColor(flat, cv2.COLOR_BGR2GRAY, dst=self._buffer('gray_batch', flat.shape[:2]))
+            else:
+                grays = cv2.cvtColor(flat, cv2.COLOR_BGR2GRAY)
+            grays = grays.reshape(count, height, width)
+            return [self.detect_gray(gray) for gray in grays]
+        return [self.detect_faces(frame) for frame in frames]
+    
+    def detect_gray(self, gray):
+        """
+        Detect faces in a grayscale image, downscaling it first if a
+        detection width is set
+        
+        Args:
+            gray: Grayscale image (numpy array)
+            
+        Returns:
+            List of face coordinates (x, y, w, h) at the input resolution
+        """
+        scale = 1.0
+        if self.detection_width and gray.shape[1] > self.detection_width:
+            scale = self.detection_width / gray.shape[1]
+            size = (self.detection_width, max(1, round(gray.shape[0] * scale)))
+            if self.zero_copy:
+                small = self._buffer('small', (size[1], size[0]))
+                gray = cv2.resize(gray, size, dst=small, interpolation=cv2.INTER_AREA)
+            else:
+                gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
         
         # Detect faces
         faces = self.face_cascade.detectMultiScale(
@@ -40,21 +126,76 @@ class FaceDetector:
             minSize=(30, 30)
         )
         
+        if scale != 1.0 and len(faces):
+            faces = np.round(faces / scale).astype(np.int32)
         return faces
     
-    def draw_faces(self, image, faces):
+    def detect_in_region(self, gray, box, margin=0.5, target_size=64):
+        """
+        Re-detect a face near its previous position
+
+        Searches only a window around the box, downscaled so the face is
+        about target_size pixels wide, and only at scales close to the
+        previous face size.
+        
+        Args:
+            gray: Full-resolution grayscale image
+            box: Previous face coordinates (x, y, w, h)
+            margin: Window padding as a fraction of the face size
+            target_size: Face width to search at, in pixels
+            
+        Returns:
+            The face coordinates closest to the previous box, or None if lost
+        """
+        x, y, w, h = (int(v) for v in box)
+        pad_x, pad_y = int(w * margin), int(h * margin)
+        x0, y0 = max(0, x - pad_x), max(0, y - pad_y)
+        x1, y1 = min(gray.shape[1], x + w + pad_x), min(gray.shape[0], y + h + pad_y)
+        if x1 - x0 < w // 2 or y1 - y0 < h // 2:
+            return None
+        
+        roi = gray[y0:y1, x0:x1]
+        scale = min(1.0, target_size / max(w, 1))
+        if scale != 1.0:
+            roi = cv2.resize(roi, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        size = w * scale
+        faces = self.face_cascade.detectMultiScale(
+            roi,
+            scaleFactor=1.1,
+            minNeighbors=3,
+            minSize=(max(20, int(size * 0.7)),) * 2,
+            maxSize=(int(size * 1.4) + 1,) * 2
+        )
+        if not len(faces):
+            return None
+        
+        # Keep the hit closest to where the face was
+        centers = faces[:, :2] + faces[:, 2:] / 2
+        previous = np.array([(x - x0 + w / 2) * scale, (y - y0 + h / 2) * scale])
+        fx, fy, fw, fh = faces[int(np.argmin(((centers - previous) ** 2).sum(axis=1)))] / scale
+        return np.array([fx + x0, fy + y0, fw, fh]).round().astype(np.int32)
+    
+    def draw_faces(self, image, faces, in_place=False):
         """
         Draw rectangles around detected faces
         
         Args:
             image: Input image
             faces: List of face coordinates
+            in_place: Draw directly on the input image instead of a copy
             
         Returns:
             Image with rectangles drawn around faces
         """
-        # Create a copy of the image
-        img_copy = image.copy()
+        if in_place:
+            img_copy = image
+        elif self.zero_copy:
+            # Copy into the reused output buffer
+            img_copy = self._buffer('output', image.shape)
+            np.copyto(img_copy, image)
+        else:
+            # Create a copy of the image
+            img_copy = image.copy()
         
         # Draw rectangles around each face
         for (x, y, w, h) in faces:
@@ -62,24 +203,359 @@ class FaceDetector:
         
         return img_copy
 
+class FaceTracker:
+    """
+    Fast face detection for video streams
+
+    Runs full (downscaled) detection only every detect_interval frames or
+    when a tracked face is lost, and in between follows each face by
+    re-detecting it within a small window around its last position. Holds
+    state between frames, so it must see the frames of a stream in order.
+    """
+    def __init__(self, detector=None, detect_interval=5, margin=0.5):
+        self.detector = detector or FaceDetector(detection_width=640)
+        self.detect_interval = detect_interval
+        self.margin = margin
+        self.faces = np.empty((0, 4), dtype=np.int32)
+        self.frames_since_detection = None
+        self.full_detections = 0
+    
+    def detect_faces(self, image):
+        """
+        Detect or track faces in the next frame of the stream
+        
+        Args:
+            image: Input frame (numpy array)
+            
+        Returns:
+            List of face coordinates (x, y, w, h)
+        """
+        gray = self.detector.to_gray(image)
+        
+        due = self.frames_since_detection is None or self.frames_since_detection + 1 >= self.detect_interval
+        if not due:
+            tracked = [self.detector.detect_in_region(gray, box, self.margin) for box in self.faces]
+            if all(box is not None for box in tracked):
+                self.faces = np.array(tracked, dtype=np.int32).reshape(-1, 4)
+                self.frames_since_detection += 1
+                return self.faces
+        
+        # Scheduled detection, or a face was lost
+        faces = self.detector.detect_gray(gray)
+        self.faces = np.asarray(faces, dtype=np.int32).reshape(-1, 4)
+        self.frames_since_detection = 0
+        self.full_detections += 1
+        return self.faces
+    
+    def reset(self):
+        """
+        Forget tracked faces, e.g. on a scene cut or a new stream
+        """
+        self.faces = np.empty((0, 4), dtype=np.int32)
+        self.frames_since_detection = None
+
+def _uniform_lbp_table():
+    """
+    Map 8-bit LBP codes to 59 bins: one per uniform pattern (at most two
+    0/1 transitions around the circle) and one shared by all others
+    """
+    table = np.full(256, 58, dtype=np.intp)
+    next_bin = 0
+    for code in range(256):
+        bits = [(code >> i) & 1 for i in range(8)]
+        transitions = sum(bits[i] != bits[(i + 1) % 8] for i in range(8))
+        if transitions <= 2:
+            table[code] = next_bin
+            next_bin += 1
+    return table
+
+UNIFORM_LBP_TABLE = _uniform_lbp_table()
+LBP_BINS = 59
+
+# Neighbour offsets (row, column) clockwise from the top-left pixel
+LBP_NEIGHBOURS = ((-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1))
+
+class EmbeddingGallery:
+    """
+    Face feature vectors stored as one contiguous float32 matrix
+
+    With a directory path, the matrix and the per-row label ids live in raw
+    files that are memory-mapped on open (so startup does not depend on the
+    gallery size) and appended to on enrollment. Without a path the gallery
+    is kept in memory.
+    """
+    def __init__(self, dim, path=None):
+        self.dim = dim
+        self.path = path
+        self._names = None
+        self._name_ids = None
+        if path:
+            os.makedirs(path, exist_ok=True)
+            meta_path = os.path.join(path, 'meta.json')
+            if os.path.exists(meta_path):
+                with open(meta_path) as f:
+                    stored_dim = json.load(f)['dim']
+                if stored_dim != dim:
+                    raise ValueError(f"Gallery at {path} has {stored_dim}-dimensional features, expected {dim}")
+            else:
+                with open(meta_path, 'w') as f:
+                    json.dump({'dim': dim}, f)
+            self._map()
+        else:
+            self._embeddings = np.empty((0, dim), dtype=np.float32)
+            self._label_ids = np.empty(0, dtype=np.int32)
+            self._count = 0
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _map(self):
+        """
+        Memory-map the gallery files at their current size
+        """
+        for name in ('embeddings.f32', 'label_ids.i32'):
+            open(self._file(name), 'ab').close()
+        rows = os.path.getsize(self._file('embeddings.f32')) // (self.dim * 4)
+        # Tolerate a write interrupted between the two files
+        self._count = min(rows, os.path.getsize(self._file('label_ids.i32')) // 4)
+        if self._count:
+            self._embeddings = np.memmap(
+                self._file('embeddings.f32'), dtype=np.float32, mode='r', shape=(self._count, self.dim)
+            )
+            self._label_ids = np.memmap(
+                self._file('label_ids.i32'), dtype=np.int32, mode='r', shape=(self._count,)
+            )
+        else:
+            self._embeddings = np.empty((0, self.dim), dtype=np.float32)
+            self._label_ids = np.empty(0, dtype=np.int32)
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def embeddings(self):
+        """
+        The (count, dim) float32 feature matrix
+        """
+        return self._embeddings[:self._count]
+
+    @property
+    def names(self):
+        """
+        Label names indexed by label id (loaded on first use)
+        """
+        if self._names is None:
+            self._names = []
+            if self.path and os.path.exists(self._file('labels.txt')):
+                with open(self._file('labels.txt'), encoding='utf-8') as f:
+                    self._names = f.read().split('\n')[:-1]
+            self._name_ids = {name: i for i, name in enumerate(self._names)}
+        return self._names
+
+    def label(self, row):
+        """
+        Label name of a gallery row
+        """
+        return self.names[self._label_ids[row]]
+
+    def append(self, features, labels):
+        """
+        Add feature vectors with their labels, without touching existing rows
+
+        Args:
+            features: Array of shape (n, dim)
+            labels: n label names
+        """
+        features = np.ascontiguousarray(features, dtype=np.float32).reshape(-1, self.dim)
+        labels = [str(label) for label in labels]
+        if len(labels) != len(features):
+            raise ValueError("Number of labels does not match number of feature vectors")
+        if not len(features):
+            return
+
+        names = self.names
+        new_names = []
+        ids = np.empty(len(labels), dtype=np.int32)
+        for i, label in enumerate(labels):
+            if '\n' in label:
+                raise ValueError("Labels cannot contain newlines")
+            label_id = self._name_ids.get(label)
+            if label_id is None:
+                label_id = self._name_ids[label] = len(names)
+                names.append(label)
+                new_names.append(label)
+            ids[i] = label_id
+
+        if self.path:
+            if new_names:
+                with open(self._file('labels.txt'), 'a', encoding='utf-8') as f:
+                    f.write(''.join(name + '\n' for name in new_names))
+            # Drop a partially written tail row before appending
+            for name, array, row_bytes in (('embeddings.f32', features, self.dim * 4), ('label_ids.i32', ids, 4)):
+                with open(self._file(name), 'r+b') as f:
+                    f.truncate(self._count * row_bytes)
+                    f.seek(0, os.SEEK_END)
+                    f.write(array.tobytes())
+            self._map()
+        else:
+            needed = self._count + len(features)
+            if needed > len(self._embeddings):
+                capacity = max(needed, 2 * len(self._embeddings), 64)
+                embeddings = np.empty((capacity, self.dim), dtype=np.float32)
+                embeddings[:self._count] = self._embeddings[:self._count]
+                label_ids = np.empty(capacity, dtype=np.int32)
+                label_ids[:self._count] = self._label_ids[:self._count]
+                self._embeddings, self._label_ids = embeddings, label_ids
+            self._embeddings[self._count:needed] = features
+            self._label_ids[self._count:needed] = ids
+            self._count = needed
+
+    def clear(self):
+        """
+        Remove all rows and labels
+        """
+        if self.path:
+            self._embeddings = self._label_ids = None
+            for name in ('embeddings.f32', 'label_ids.i32', 'labels.txt'):
+                open(self._file(name), 'wb').close()
+            self._map()
+        else:
+            self._count = 0
+        self._names = None
+
+    def search(self, queries, chunk_rows=65536):
+        """
+        Nearest neighbour by dot product for a batch of queries
+
+        Scans the gallery in chunks with one matrix product per chunk, so
+        memory use stays bounded however large the (memory-mapped) gallery is.
+
+        Args:
+            queries: Array of shape (batch, dim), L2-normalized
+
+        Returns:
+            (row indices, similarities), each of shape (batch,); rows are -1
+            for an empty gallery
+        """
+        queries = np.ascontiguousarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        batch = len(queries)
+        best_rows = np.full(batch, -1, dtype=np.int64)
+        best_scores = np.full(batch, -np.inf, dtype=np.float32)
+        embeddings = self.embeddings
+        columns = np.arange(batch)
+        queries_t = np.ascontiguousarray(queries.T)
+        for start in range(0, self._count, chunk_rows):
+            # (chunk, batch) scores; gallery-major order streams rows through BLAS
+            scores = embeddings[start:start + chunk_rows] @ queries_t
+            rows = scores.argmax(axis=0)
+            values = scores[rows, columns]
+            better = values > best_scores
+            best_scores[better] = values[better]
+            best_rows[better] = rows[better] + start
+        return best_rows, best_scores
+
 class FaceRecognizer:
     """
-    Face recognition functionality (incomplete)
+    Face recognition with LBP histogram features and a nearest-neighbour gallery
     """
-    def __init__(self):
-        # TODO: Initialize face recognition model
-        pass
+    def __init__(self, gallery_path=None, face_size=64, grid=4, threshold=None):
+        """
+        Args:
+            gallery_path: Directory for a persistent, memory-mapped gallery
+                (None keeps the gallery in memory)
+            face_size: Side length face crops are resized to
+            grid: Face crops are split into grid x grid cells, one LBP
+                histogram each
+            threshold: Minimum cosine similarity to accept a match. There is
+                no default: LBP histograms of unrelated crops (even noise)
+                routinely score 0.8-0.9, so the cutoff has to be calibrated
+                on labelled faces from the target camera. None always
+                returns the nearest label.
+        """
+        self.face_size = face_size
+        self.grid = grid
+        self.threshold = threshold
+        self.dim = grid * grid * LBP_BINS
+
+        # Cell index of every LBP code position, offset into the feature vector
+        inner = face_size - 2
+        cell_rows = np.arange(inner) * grid // inner
+        cells = cell_rows[:, None] * grid + cell_rows[None, :]
+        self._bin_offsets = (cells * LBP_BINS).ravel()
+
+        self.gallery = EmbeddingGallery(self.dim, gallery_path)
+
+    def _prepare(self, face_images):
+        """
+        Stack face crops as equalized grayscale squares of face_size
+        """
+        size = (self.face_size, self.face_size)
+        prepared = np.empty((len(face_images), self.face_size, self.face_size), dtype=np.uint8)
+        for i, face in enumerate(face_images):
+            if face.ndim == 3:
+                face = cv2.cvtColor(face, cv2.COLOR_BGR2GRAY)
+            face = cv2.resize(face, size, interpolation=cv2.INTER_AREA)
+            cv2.equalizeHist(face, dst=prepared[i])
+        return prepared
+
+    def compute_features(self, face_images):
+        """
+        Turn face crops into fixed-length feature vectors
+        
+        Args:
+            face_images: List of face images (BGR or grayscale, any size)
+            
+        Returns:
+            Array of shape (n, dim) of L2-normalized float32 vectors
+        """
+        if not len(face_images):
+            return np.empty((0, self.dim), dtype=np.float32)
+        faces = self._prepare(face_images)
+        count = len(faces)
+
+        # 8-neighbour LBP codes for the whole batch at once
+        center = faces[:, 1:-1, 1:-1]
+        codes = np.zeros(center.shape, dtype=np.uint8)
+        last = self.face_size - 1
+        for bit, (dy, dx) in enumerate(LBP_NEIGHBOURS):
+            neighbour = faces[:, 1 + dy:last + dy, 1 + dx:last + dx]
+            codes |= (neighbour >= center).astype(np.uint8) << bit
+
+        # Per-cell histograms of uniform patterns via a single bincount
+        bins = UNIFORM_LBP_TABLE[codes.reshape(count, -1)] + self._bin_offsets
+        bins += (np.arange(count) * self.dim)[:, None]
+        histograms = np.bincount(bins.ravel(), minlength=count * self.dim)
+        features = histograms.reshape(count, self.dim).astype(np.float32)
+
+        # Hellinger kernel: square roots of the counts, so the dot product
+        # of unit vectors compares histograms
+        np.sqrt(features, out=features)
+        features /= np.maximum(np.linalg.norm(features, axis=1, keepdims=True), 1e-12)
+        return features
     
     def train_model(self, face_images, labels):
         """
         Train the face recognition model
         
+        Replaces the gallery with the given faces; use enroll() to add
+        faces without retraining.
+        
+        Args:
+            face_images: List of face images
+            labels: List of corresponding labels
+        """
+        self.gallery.clear()
+        self.enroll(face_images, labels)
+
+    def enroll(self, face_images, labels):
+        """
+        Add faces to the gallery incrementally
+        
         Args:
             face_images: List of face images
             labels: List of corresponding labels
         """
-        # TODO: Implement model training
-        pass
+        self.gallery.append(self.compute_features(face_images), labels)
     
     def recognize_face(self, face_image):
         """
@@ -91,55 +567,442 @@ class FaceRecognizer:
         Returns:
             Predicted label and confidence
         """
-        # TODO: Implement face recognition
-        pass
+        return self.recognize_faces([face_image])[0]
+
+    def recognize_faces(self, face_images):
+        """
+        Recognize several faces with one batched gallery search
+        
+        Args:
+            face_images: List of face images
+            
+        Returns:
+            List of (label, confidence) tuples; label is None when the gallery
+            is empty or a threshold is set and the best match is below it
+        """
+        if not len(face_images):
+            return []
+        rows, scores = self.gallery.search(self.compute_features(face_images))
+        results = []
+        for row, score in zip(rows, scores):
+            if row < 0:
+                results.append((None, 0.0))
+            else:
+                accepted = self.threshold is None or score >= self.threshold
+                label = self.gallery.label(row) if accepted else None
+                results.append((label, float(score)))
+        return results
+
+    def recognize_frame(self, image, faces):
+        """
+        Recognize all detected faces in a frame at once
+        
+        Args:
+            image: Input frame
+            faces: List of face coordinates (x, y, w, h) from FaceDetector
+            
+        Returns:
+            List of (label, confidence) tuples, one per face
+        """
+        crops = [image[y:y + h, x:x + w] for (x, y, w, h) in faces]
+        return self.recognize_faces(crops)
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.webp')
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv')
+
+class DropOldestQueue:
+    """
+    Bounded FIFO queue connecting pipeline stages
+
+    When full, put() either waits for space or, with drop_oldest, discards
+    the oldest queued item so live sources never fall behind.
+    """
+    def __init__(self, maxsize, drop_oldest=False, on_drop=None):
+        self.maxsize = maxsize
+        self.drop_oldest = drop_oldest
+        self.on_drop = on_drop
+        self.dropped = 0
+        self._items = deque()
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def put(self, item):
+        """
+        Add an item, dropping the oldest or waiting when the queue is full
+
+        Returns:
+            False if the queue was closed, True otherwise
+        """
+        with self._condition:
+            while len(self._items) >= self.maxsize and not self._closed:
+                if self.drop_oldest:
+                    oldest = self._items.popleft()
+                    self.dropped += 1
+                    if self.on_drop:
+                        self.on_drop(oldest)
+                else:
+                    self._condition.wait()
+            if self._closed:
+                return False
+            self._items.append(item)
+            self._condition.notify_all()
+            return True
+
+    def get(self, timeout=None):
+        """
+        Remove and return the oldest item
+
+        Returns:
+            The item, or None once the queue is closed and drained (or on timeout)
+        """
+        with self._condition:
+            if not self._items and not self._closed:
+                self._condition.wait(timeout)
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            self._condition.notify_all()
+            return item
+
+    @property
+    def exhausted(self):
+        """
+        Whether the queue is closed and has no items left
+        """
+        with self._condition:
+            return self._closed and not self._items
+
+    def close(self):
+        """
+        Stop accepting items and wake up all waiting threads
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+class FrameResult:
+    """
+    A frame together with the faces detected in it
+    """
+    __slots__ = ('index', 'name', 'frame', 'faces')
+
+    def __init__(self, index, name, frame, faces):
+        self.index = index
+        self.name = name
+        self.frame = frame
+        self.faces = faces
+
+def is_live_source(source):
+    """
+    Whether a source refers to a camera rather than a file or directory
+    """
+    return isinstance(source, int) or (isinstance(source, str) and source.isdigit())
+
+def iter_frames(source):
+    """
+    Read frames from a webcam, a video file or a directory of images
+
+    Args:
+        source: Camera index, video file path or image directory path
+
+    Yields:
+        (name, frame) tuples in capture order
+    """
+    if os.path.isdir(str(source)):
+        for filename in sorted(os.listdir(source)):
+            if filename.lower().endswith(IMAGE_EXTENSIONS):
+                frame = cv2.imread(os.path.join(source, filename))
+                if frame is not None:
+                    yield filename, frame
+        return
+
+    cap = cv2.VideoCapture(int(source) if is_live_source(source) else source)
+    if not cap.isOpened():
+        raise IOError(f"Cannot open video source: {source}")
+    try:
+        index = 0
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            yield f"frame_{index:06d}", frame
+            index += 1
+    finally:
+        cap.release()
+
+class FramePipeline:
+    """
+    Threaded capture -> detect -> render pipeline
+
+    A producer thread reads frames into a bounded queue, a pool of detector
+    threads (OpenCV releases the GIL while detecting) each with its own
+    FaceDetector, and the consumer receives results back in capture order.
+    """
+    def __init__(self, workers=None, queue_size=None, drop_frames=False, detector_factory=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size or 2 * self.workers
+        self.drop_frames = drop_frames
+        self.detector_factory = detector_factory or (lambda: FaceDetector(own_cascade=True))
+        self.frames_processed = 0
+        self.frames_dropped = 0
+        self.elapsed = 0.0
+
+    @property
+    def fps(self):
+        """
+        Sustained throughput of the last run in processed frames per second
+        """
+        return self.frames_processed / self.elapsed if self.elapsed else 0.0
+
+    def run(self, frames):
+        """
+        Run the pipeline over a frame iterator
+
+        Args:
+            frames: Iterable of (name, frame) tuples, e.g. from iter_frames()
+
+        Yields:
+            FrameResult objects in capture order; frames dropped from a full
+            input queue are skipped
+        """
+        stop = threading.Event()
+        dropped = set()
+        input_queue = DropOldestQueue(
+            self.queue_size,
+            drop_oldest=self.drop_frames,
+            on_drop=lambda item: dropped.add(item[0])
+        )
+        output_queue = DropOldestQueue(self.queue_size)
+        errors = []
+        running = [self.workers]
+        running_lock = threading.Lock()
+
+        def produce():
+            try:
+                for index, (name, frame) in enumerate(frames):
+                    if stop.is_set() or not input_queue.put((index, name, frame)):
+                        break
+            except Exception as e:
+                errors.append(e)
+            finally:
+                input_queue.close()
+                if hasattr(frames, 'close'):
+                    frames.close()
+
+        def detect():
+            try:
+                detector = self.detector_factory()
+                while not stop.is_set():
+                    item = input_queue.get(timeout=0.1)
+                    if item is None:
+                        if input_queue.exhausted:
+                            break
+                        continue
+                    index, name, frame = item
+                    output_queue.put(FrameResult(index, name, frame, detector.detect_faces(frame)))
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                with running_lock:
+                    running[0] -= 1
+                    if running[0] == 0:
+                        output_queue.close()
+
+        threads = [threading.Thread(target=produce, name='frame-producer', daemon=True)]
+        threads += [
+            threading.Thread(target=detect, name=f'face-detector-{i}', daemon=True)
+            for i in range(self.workers)
+        ]
+
+        self.frames_processed = 0
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        # Reorder results by frame index, skipping frames that were dropped
+        pending = {}
+        next_index = 0
+        try:
+            while True:
+                result = output_queue.get(timeout=0.1)
+                if result is not None:
+                    pending[result.index] = result
+                elif output_queue.exhausted:
+                    break
+                while True:
+                    if next_index in pending:
+                        self.frames_processed += 1
+                        yield pending.pop(next_index)
+                    elif next_index in dropped:
+                        dropped.discard(next_index)
+                    else:
+                        break
+                    next_index += 1
+            if errors:
+                raise errors[0]
+            for index in sorted(pending):
+                self.frames_processed += 1
+                yield pending.pop(index)
+        finally:
+            stop.set()
+            input_queue.close()
+            output_queue.close()
+            self.frames_dropped = input_queue.dropped
+            self.elapsed = time.perf_counter() - started
+
+class FrameWriter:
+    """
+    Writes annotated frames to a video file or an image directory
+    """
+    def __init__(self, path, fps=30.0):
+        self.path = path
+        self.fps = fps
+        self._video = None
+        if not path.lower().endswith(VIDEO_EXTENSIONS):
+            os.makedirs(path, exist_ok=True)
+
+    def write(self, name, frame):
+        """
+        Append a frame to the video, or save it as an image named after the input frame
+        """
+        if self.path.lower().endswith(VIDEO_EXTENSIONS):
+            if self._video is None:
+                height, width = frame.shape[:2]
+                fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+                self._video = cv2.VideoWriter(self.path, fourcc, self.fps, (width, height))
+            self._video.write(frame)
+        else:
+            filename = name if name.lower().endswith(IMAGE_EXTENSIONS) else f"{name}.jpg"
+            cv2.imwrite(os.path.join(self.path, filename), frame)
+
+    def close(self):
+        """
+        Finish the video file, if any
+        """
+        if self._video is not None:
+            self._video.release()
+            self._video = None
+
+def process_stream(
+    source=0,
+    workers=None,
+    queue_size=None,
+    display=True,
+    output=None,
+    json_path=None,
+    detection_width=None,
+    track_interval=None
+):
+    """
+    Detect faces in a webcam feed, video file or image directory
+
+    Args:
+        source: Camera index, video file path or image directory path
+        workers: Number of detector threads (default: CPU count)
+        queue_size: Capacity of the queues between stages
+        display: Show annotated frames in a window (press 'q' to quit)
+        output: Video file or directory to write annotated frames to
+        json_path: JSON Lines file to write per-frame detections to
+        detection_width: Detect on frames downscaled to at most this width
+        track_interval: Run full detection every this many frames and track
+            faces in between (uses a single detector thread, since tracking
+            needs the frames in order)
+
+    Returns:
+        The FramePipeline, with frame counts and sustained FPS of the run
+    """
+    if track_interval:
+        detector_factory = lambda: FaceTracker(
+            FaceDetector(own_cascade=True, detection_width=detection_width, zero_copy=True),
+            detect_interval=track_interval
+        )
+        workers = 1
+    else:
+        detector_factory = lambda: FaceDetector(
+            own_cascade=True,
+            detection_width=detection_width,
+            zero_copy=True
+        )
+    pipeline = FramePipeline(
+        workers=workers,
+        queue_size=queue_size,
+        drop_frames=is_live_source(source),
+        detector_factory=detector_factory
+    )
+    writer = FrameWriter(output) if output else None
+    detections = open(json_path, 'w') if json_path else None
+    renderer = FaceDetector()
+
+    try:
+        for result in pipeline.run(iter_frames(source)):
+            if detections:
+                faces = [[int(v) for v in face] for face in result.faces]
+                detections.write(json.dumps({"frame": result.name, "faces": faces}) + '\n')
+
+            if writer or display:
+                # Frames belong to the pipeline, so annotate them in place
+                annotated = renderer.draw_faces(result.frame, result.faces, in_place=True)
+                if writer:
+                    writer.write(result.name, annotated)
+                if display:
+                    cv2.imshow('Face Detection', annotated)
+                    # Exit on 'q' key
+                    if cv2.waitKey(1) & 0xFF == ord('q'):
+                        break
+    finally:
+        if writer:
+            writer.close()
+        if detections:
+            detections.close()
+        if display:
+            cv2.destroyAllWindows()
+
+    return pipeline
 
 def process_webcam():
     """
     Process webcam feed for face detection
     """
-    # Initialize face detector
-    detector = FaceDetector()
-    
-    # Open webcam
-    cap = cv2.VideoCapture(0)
-    
-    while True:
-        # Read frame
-        ret, frame = cap.read()
-        
-        if not ret:
-            break
-        
-        # Detect faces
-        faces = detector.detect_faces(frame)
-        
-        # Draw faces
-        result = detector.draw_faces(frame, faces)
-        
-        # Display result
-        cv2.imshow('Face Detection', result)
-        
-        # Exit on 'q' key
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
-    
-    # Release resources
-    cap.release()
-    cv2.destroyAllWindows()
+    process_stream(0)
 
 # Main function
 def main():
     """
     Main function
     """
-    # TODO: Add command line arguments
     # TODO: Add frontend interface
     # TODO: Add user authentication
     # TODO: Add database integration
-    
-    # For now, just process webcam feed
-    process_webcam()
+    arg_parser = argparse.ArgumentParser(description="Face detection on a webcam, video file or image directory")
+    arg_parser.add_argument("--source", default="0",
+                            help="Camera index, video file or image directory (default: webcam 0)")
+    arg_parser.add_argument("--headless", action="store_true", help="Do not open a display window")
+    arg_parser.add_argument("--output", help="Video file (.mp4/.avi) or directory for annotated frames")
+    arg_parser.add_argument("--json", dest="json_path", help="JSON Lines file for per-frame detections")
+    arg_parser.add_argument("--workers", type=int, default=None, help="Detector threads (default: CPU count)")
+    arg_parser.add_argument("--queue-size", type=int, default=None, help="Capacity of the stage queues")
+    arg_parser.add_argument("--detection-width", type=int, default=None,
+                            help="Detect on frames downscaled to this width (e.g. 640)")
+    arg_parser.add_argument("--track-interval", type=int, default=None,
+                            help="Full detection every K frames, tracking faces in between")
+    args = arg_parser.parse_args()
+
+    pipeline = process_stream(
+        args.source,
+        workers=args.workers,
+        queue_size=args.queue_size,
+        display=not args.headless,
+        output=args.output,
+        json_path=args.json_path,
+        detection_width=args.detection_width,
+        track_interval=args.track_interval
+    )
+    print(
+        f"{pipeline.frames_processed} frames in {pipeline.elapsed:.2f}s "
+        f"({pipeline.fps:.1f} FPS sustained, {pipeline.frames_dropped} dropped) "
+        f"with {pipeline.workers} detector threads"
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Production server configuration
+
+Runs the API on several uvicorn worker processes under gunicorn:
+
+    gunicorn -c gunicorn.conf.py main:app
+
+The app is imported once in the master and forked into the workers, and each
+worker is gracefully recycled after a number of requests (or, through
+MAX_WORKER_MEMORY_MB in main.py, a memory limit). Workers share analysis
+results through the SQLite result store, so repeats hit on any worker.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app (and its parsers/analyzers) once before forking
+preload_app = True
+
+# Graceful recycling: restart each worker after this many requests, staggered
+# so they do not all restart at once
+max_requests = int(os.environ.get("MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("MAX_REQUESTS_JITTER", max_requests // 10))
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", 30))
+timeout = int(os.environ.get("WORKER_TIMEOUT", 120))
+keepalive = 5
+
+accesslog = os.environ.get("ACCESS_LOG", "-")
@@ -1,18 +1,28 @@
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, HttpUrl
 from typing import Optional, List, Dict, Any
 import shutil
 import os
+import signal
 import tempfile
 import json
-import httpx
+import threading
 import time
 from pathlib import Path
 
-from parser import FileParser
+from parser import FileParser, warm_up as warm_up_parser
 from scorer import ProjectScorer
-from ai_module import ProjectAnalyzer
+from ai_module import ProjectAnalyzer, ANALYSIS_VERSION, DEFAULT_SYMBOL_PAGE_SIZE
+from result_store import ResultStore, DEFAULT_STORE_PATH
+
+# Detailed responses can be large; serialize them with orjson when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = FastAPI(title="Project Revival AI API")
 
@@ -25,6 +35,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large (detailed) responses for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Models
 class ProjectFiles(BaseModel):
     code: Optional[UploadFile]
@@ -55,14 +68,70 @@ file_parser = FileParser()
 project_scorer = ProjectScorer()
 project_analyzer = ProjectAnalyzer()
 
+# Heavy parser dependencies (PyMuPDF, python-docx, libmagic) are imported on
+# first use; set WARM_IMPORTS=1 to load them in the background after startup
+WARM_IMPORTS = os.environ.get("WARM_IMPORTS", "0") == "1"
+
+@app.on_event("startup")
+async def warm_imports():
+    """
+    Start loading heavy dependencies without delaying the first connections
+    """
+    if WARM_IMPORTS:
+        threading.Thread(target=warm_up_parser, name="warm-imports", daemon=True).start()
+
+# Results shared by all worker processes on this host
+result_store = ResultStore(
+    path=os.environ.get("RESULT_STORE_PATH", DEFAULT_STORE_PATH),
+    ttl_seconds=float(os.environ.get("RESULT_STORE_TTL", 24 * 60 * 60))
+)
+
+# Recycle a server worker once its resident memory passes this many MB (0 disables).
+# Only meant for the multi-worker server mode, where gunicorn replaces the worker,
+# and only effective where /proc/self/statm is available (Linux).
+MAX_WORKER_MEMORY_MB = int(os.environ.get("MAX_WORKER_MEMORY_MB", "0"))
+_recycling = False
+
+def _resident_memory_mb() -> Optional[float]:
+    """
+    Current resident memory of this process in MB, or None where
+    /proc/self/statm is unavailable (getrusage only reports the peak)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        return None
+
+@app.middleware("http")
+async def recycle_on_memory_limit(request, call_next):
+    """
+    Ask the server to gracefully replace this worker when it grows too large
+    """
+    global _recycling
+    response = await call_next(request)
+    if MAX_WORKER_MEMORY_MB and not _recycling:
+        resident_mb = _resident_memory_mb()
+        if resident_mb is not None and resident_mb > MAX_WORKER_MEMORY_MB:
+            _recycling = True
+            os.kill(os.getpid(), signal.SIGTERM)
+    return response
+
 @app.post("/api/analyze/files", response_model=AnalysisResult)
 async def analyze_files(
     code: Optional[UploadFile] = File(None),
     documentation: Optional[UploadFile] = File(None),
-    notes: Optional[str] = Form(None)
+    notes: Optional[str] = Form(None),
+    detail: bool = Form(False),
+    symbols_limit: int = Form(DEFAULT_SYMBOL_PAGE_SIZE)
 ):
     """
     Analyze uploaded project files
+    
+    With detail=true the response also includes the full per-file insights
+    (symbols, routes, imports, skipped files) in a columnar layout, with the
+    first page of symbols; further pages come from
+    /api/analysis/{analysis_id}/symbols.
     """
     if not code and not documentation:
         raise HTTPException(
@@ -70,27 +139,50 @@ async def analyze_files(
             detail="At least one file (code or documentation) must be provided"
         )
     
+    uploaded_files = []
     try:
-        uploaded_files = []
         code_content = {}
         doc_content = None
+        code_bytes = await code.read() if code else None
+        doc_bytes = await documentation.read() if documentation else None
+        
+        # Serve repeats from the shared store, whichever worker computed them
+        cache_key = ResultStore.make_key(
+            str(ANALYSIS_VERSION).encode(),
+            code.filename.encode() if code else None,
+            code_bytes,
+            documentation.filename.encode() if documentation else None,
+            doc_bytes,
+            notes.encode() if notes else None
+        )
+        details_key = f"{cache_key}:details"
+        # SQLite calls can block on the shared write lock, so keep them off the event loop
+        cached = await run_in_threadpool(result_store.get, cache_key)
+        if cached is not None and not detail:
+            return cached
+        if cached is not None:
+            details = await run_in_threadpool(result_store.get, details_key)
+            if details is not None:
+                return _detailed_response(cached, cache_key, details, symbols_limit)
+        
+        skipped_files = []
         
         # Process code file (ZIP)
         if code:
             code_path = file_parser.save_uploaded_file(
-                await code.read(),
+                code_bytes,
                 code.filename,
                 str(UPLOAD_DIR)
             )
             uploaded_files.append(code_path)
             
             if code.filename.endswith('.zip'):
-                code_content = file_parser.parse_zip(code_path)
+                code_content = file_parser.parse_zip(code_path, skipped_files)
         
         # Process documentation file (PDF/DOCX)
         if documentation:
             doc_path = file_parser.save_uploaded_file(
-                await documentation.read(),
+                doc_bytes,
                 documentation.filename,
                 str(UPLOAD_DIR)
             )
@@ -108,19 +200,65 @@ async def analyze_files(
         analysis_result = await project_analyzer.analyze_project(
             code_content,
             doc_content,
-            notes
+            notes,
+            detailed=detail
         )
+        details = analysis_result.pop("details", None)
         
         # Add scores to analysis result
         analysis_result["scores"] = scores
         
-        # Clean up uploaded files
-        file_parser.cleanup_files(uploaded_files)
-        
+        await run_in_threadpool(result_store.put, cache_key, analysis_result)
+        if details is not None:
+            details["skipped_files"] = skipped_files
+            await run_in_threadpool(result_store.put, details_key, details)
+            return _detailed_response(analysis_result, cache_key, details, symbols_limit)
         return analysis_result
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing files: {str(e)}")
+    finally:
+        # Clean up uploaded files
+        file_parser.cleanup_files(uploaded_files)
+
+def _compact_json_response(content):
+    """
+    JSON response without whitespace, encoded with orjson when installed
+    """
+    if orjson is not None:
+        body = orjson.dumps(content)
+    else:
+        body = json.dumps(content, separators=(",", ":")).encode("utf-8")
+    return Response(content=body, media_type="application/json")
+
+def _detailed_response(analysis_result, analysis_id, details, symbols_limit):
+    """
+    Analysis plus the first page of detailed insights, as compact JSON
+    """
+    return _compact_json_response({
+        **analysis_result,
+        "analysis_id": analysis_id,
+        "details": project_analyzer.page_details(details, 0, symbols_limit)
+    })
+
+@app.get("/api/analysis/{analysis_id}/symbols")
+async def analysis_symbols(analysis_id: str, offset: int = 0, limit: int = DEFAULT_SYMBOL_PAGE_SIZE):
+    """
+    Page through the symbols of a detailed analysis
+    """
+    details = await run_in_threadpool(result_store.get, f"{analysis_id}:details")
+    if details is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired analysis")
+    
+    # "file" columns index into the "files" list of the initial detailed response
+    page = project_analyzer.page_details(details, offset, limit)
+    return _compact_json_response({
+        "symbol_kinds": page["symbol_kinds"],
+        "symbols": page["symbols"],
+        "symbols_total": page["symbols_total"],
+        "symbols_offset": page["symbols_offset"],
+        "next_offset": page["next_offset"]
+    })
 
 @app.post("/api/analyze/github", response_model=AnalysisResult)
 async def analyze_github(project: GithubProject):
@@ -1,12 +1,44 @@
 """
 File parser module for handling different file formats
 """
+import importlib
 import os
+import tempfile
 import zipfile
-import fitz  # PyMuPDF
-from docx import Document
+from collections import Counter
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-import magic
+
+# PyMuPDF (fitz), python-docx and python-magic (libmagic) are slow to import
+# and most requests only carry a ZIP, so they are loaded on first use.
+HEAVY_MODULES = ("fitz", "docx", "magic")
+
+@lru_cache(maxsize=None)
+def _load_module(name: str):
+    """
+    Import a heavy dependency on first use and reuse it afterwards
+    """
+    return importlib.import_module(name)
+
+@lru_cache(maxsize=1)
+def _mime_detector():
+    """
+    Shared python-magic detector, so libmagic's database is loaded once
+    """
+    return _load_module("magic").Magic(mime=True)
+
+def warm_up() -> None:
+    """
+    Import the heavy dependencies ahead of time (e.g. in a background thread)
+    """
+    for name in HEAVY_MODULES:
+        try:
+            _load_module(name)
+        except ImportError:
+            pass
+
+# A PDF line whose font is at least this much larger than the body text is a heading
+PDF_HEADING_SIZE_RATIO = 1.15
 
 class FileParser:
     """
@@ -18,14 +50,17 @@ class FileParser:
         """
         Detect file type using python-magic
         """
-        mime = magic.Magic(mime=True)
+        mime = _mime_detector()
         file_type = mime.from_buffer(file_content)
         return file_type
     
     @staticmethod
-    def parse_zip(file_path: str) -> Dict[str, str]:
+    def parse_zip(file_path: str, skipped: Optional[List[str]] = None) -> Dict[str, str]:
         """
         Parse ZIP file and extract code files
+        
+        Names of files that were not extracted (other extensions, binary
+        content) are appended to ``skipped`` when a list is given.
         """
         code_files = {}
         code_extensions = {'.py', '.js', '.jsx', '.ts', '.tsx', '.html', '.css', '.java', '.cpp', '.c', '.go', '.rs'}
@@ -39,38 +74,90 @@ class FileParser:
                             code_files[file_info.filename] = content
                         except UnicodeDecodeError:
                             # Skip binary files
+                            if skipped is not None:
+                                skipped.append(file_info.filename)
                             continue
+                elif skipped is not None and not file_info.is_dir():
+                    skipped.append(file_info.filename)
         
         return code_files
     
     @staticmethod
     def parse_pdf(file_path: str) -> str:
         """
-        Parse PDF file and extract text
+        Parse PDF file and extract text, marking up headings found from
+        font-size cues as markdown headings
         """
-        text = ""
+        lines = []
+        size_weights = Counter()
+        fitz = _load_module("fitz")  # PyMuPDF
         with fitz.open(file_path) as doc:
             for page in doc:
-                text += page.get_text()
-        return text
+                for block in page.get_text("dict")["blocks"]:
+                    for line in block.get("lines", []):
+                        spans = [span for span in line["spans"] if span["text"].strip()]
+                        line_text = "".join(span["text"] for span in line["spans"])
+                        size = round(max((span["size"] for span in spans), default=0), 1)
+                        lines.append((line_text, size))
+                        for span in spans:
+                            size_weights[round(span["size"], 1)] += len(span["text"])
+        
+        # Lines set noticeably larger than the body font become markdown
+        # headings, largest size first, so the document index can see them
+        body_size = size_weights.most_common(1)[0][0] if size_weights else 0
+        heading_sizes = sorted(
+            {size for _, size in lines if size >= body_size * PDF_HEADING_SIZE_RATIO and size > body_size},
+            reverse=True
+        )[:6]
+        heading_levels = {size: level for level, size in enumerate(heading_sizes, 1)}
+        
+        text = []
+        for line_text, size in lines:
+            level = heading_levels.get(size)
+            if level and line_text.strip():
+                text.append(f"{'#' * level} {line_text.strip()}")
+            else:
+                text.append(line_text)
+        return "\n".join(text)
     
     @staticmethod
     def parse_docx(file_path: str) -> str:
         """
-        Parse DOCX file and extract text
+        Parse DOCX file and extract text, marking up heading and list styles
+        as markdown headings and list items
         """
-        doc = Document(file_path)
-        return "\n".join([paragraph.text for paragraph in doc.paragraphs])
+        doc = _load_module("docx").Document(file_path)
+        lines = []
+        for paragraph in doc.paragraphs:
+            # Heading styles become markdown headings for the document index
+            style = paragraph.style.name if paragraph.style is not None else ""
+            level = None
+            if style == "Title":
+                level = 1
+            elif style.startswith("Heading "):
+                suffix = style[len("Heading "):]
+                level = min(6, int(suffix)) if suffix.isdigit() else None
+            if level and paragraph.text.strip():
+                lines.append(f"{'#' * level} {paragraph.text.strip()}")
+            elif style.startswith("List") and paragraph.text.strip():
+                # List Bullet, List Number, ... paragraphs carry no marker in their text
+                lines.append(f"- {paragraph.text.strip()}")
+            else:
+                lines.append(paragraph.text)
+        return "\n".join(lines)
     
     @staticmethod
     def save_uploaded_file(file_content: bytes, file_name: str, upload_dir: str) -> str:
         """
-        Save uploaded file to disk
+        Save uploaded file to disk under a unique name that keeps its extension,
+        so concurrent uploads with the same file name (from any worker process)
+        never overwrite each other
         """
         os.makedirs(upload_dir, exist_ok=True)
-        file_path = os.path.join(upload_dir, file_name)
+        suffix = os.path.splitext(os.path.basename(file_name))[1]
+        fd, file_path = tempfile.mkstemp(suffix=suffix, dir=upload_dir)
         
-        with open(file_path, "wb") as f:
+        with os.fdopen(fd, "wb") as f:
             f.write(file_content)
         
         return file_path
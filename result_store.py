@@ -0,0 +1,114 @@
+"""
+Shared local result store
+
+Caches analysis results in a SQLite database so that a result computed by
+one server worker process can serve repeat requests on any other worker.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_STORE_PATH = os.path.join(tempfile.gettempdir(), "project_revival_results.sqlite3")
+
+
+class ResultStore:
+    """
+    Process-safe key/value store for analysis results backed by SQLite (WAL)
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_STORE_PATH,
+        ttl_seconds: float = 24 * 60 * 60,
+        max_entries: int = 10000
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: Optional[bytes]) -> str:
+        """
+        Build a cache key from the request inputs (analysis version, file bytes, names, notes)
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            data = part or b""
+            digest.update(len(data).to_bytes(8, "big"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the connection lazily and per process, since the app is
+        preloaded before the server forks its workers
+        """
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+        # Store calls run in a thread pool, so only one thread opens the connection
+        with self._lock:
+            if self._connection is None or self._pid != os.getpid():
+                connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+                )
+                connection.execute("CREATE INDEX IF NOT EXISTS results_created ON results (created)")
+                self._connection = connection
+                self._pid = os.getpid()
+            return self._connection
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored result for a key, or None if missing or expired
+        """
+        row = self._connect().execute(
+            "SELECT value FROM results WHERE key = ? AND created >= ?",
+            (key, time.time() - self.ttl_seconds)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a result, pruning expired and excess entries now and then
+        """
+        connection = self._connect()
+        connection.execute(
+            "INSERT OR REPLACE INTO results (key, value, created) VALUES (?, ?, ?)",
+            (key, json.dumps(value), time.time())
+        )
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self.prune()
+
+    def prune(self) -> None:
+        """
+        Drop expired entries and keep at most max_entries of the newest
+        """
+        connection = self._connect()
+        connection.execute("DELETE FROM results WHERE created < ?", (time.time() - self.ttl_seconds,))
+        connection.execute(
+            "DELETE FROM results WHERE key NOT IN "
+            "(SELECT key FROM results ORDER BY created DESC LIMIT ?)",
+            (self.max_entries,)
+        )
+
+    def close(self) -> None:
+        """
+        Close this process's connection
+        """
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._pid = None
@@ -3,6 +3,8 @@ Project scoring module for evaluating project quality and potential
 """
 from typing import Dict, List, Optional, Tuple
 
+from document_index import build_document_index
+
 class ProjectScorer:
     """
     Handles project scoring and evaluation
@@ -61,6 +63,7 @@ class ProjectScorer:
         if not doc_content:
             return 0
             
+        index = build_document_index(doc_content)
         total_score = 0
         weights = {
             'length': 3,
@@ -69,7 +72,7 @@ class ProjectScorer:
         }
         
         # Check document length
-        doc_lines = len(doc_content.split('\n'))
+        doc_lines = index.line_count
         if doc_lines > 100:
             total_score += weights['length']
         elif doc_lines > 50:
@@ -80,14 +83,12 @@ class ProjectScorer:
             'introduction', 'overview', 'installation', 'usage', 'api',
             'requirements', 'setup', 'configuration', 'examples'
         ]
-        found_sections = sum(1 for section in common_sections if section in doc_content.lower())
+        found_sections = sum(1 for section in common_sections if index.has_topic(section))
         section_score = (found_sections / len(common_sections)) * weights['sections']
         total_score += section_score
         
         # Check for code examples
-        code_indicators = ['```', 'example:', 'usage:', '    ', '\t']
-        has_code = any(indicator in doc_content for indicator in code_indicators)
-        total_score += weights['code_examples'] if has_code else 0
+        total_score += weights['code_examples'] if index.has_code_examples else 0
         
         return min(10, total_score)
     